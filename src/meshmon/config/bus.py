@@ -33,6 +33,11 @@ class ConfigWatcher[T: Any = Config]:
                 total_subscribers=len(self.subscribers),
             )
 
+    def unsubscribe(self, callback: Callable[[T], None]) -> None:
+        with self.lock:
+            # Rebind rather than mutate so an in-flight notification loop is safe
+            self.subscribers = [cb for cb in self.subscribers if cb != callback]
+
     def new_config(self, config: Config) -> bool:
         self.logger.debug("Processing new config through preprocessor")
         new_config = self.preprocessor.preprocess(config)
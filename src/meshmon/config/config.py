@@ -99,6 +99,8 @@ class NetworkConfigLoader:
         self.latest_mtime = 0
         self.nodecfg_latest_mtime = 0
         self.last_git_check = 0
+        # One Repo per network directory so it can cache what it learns
+        self._repos: dict[Path, Repo] = {}
 
     def _load_node_config(self) -> NodeCfg | None:
         """
@@ -143,13 +145,14 @@ class NetworkConfigLoader:
             network_dir = self.config_dir / "networks" / network.directory
             if network.config_type == ConfigTypes.GIT and network.git_repo:
                 try:
-                    repo = Repo(network.git_repo, str(network_dir))
+                    repo = self._get_repo(network.git_repo, network_dir)
                     repo.clone_or_update()
                 except Exception as exc:
                     # If pull fails, reclone
                     self.logger.warning(
                         "Git pull failed for", exc=exc, network=network.directory
                     )
+                    self._repos.pop(network_dir, None)
                     shutil.rmtree(network_dir)
             else:
                 # For local configs, ensure the directory exists
@@ -472,6 +475,13 @@ class NetworkConfigLoader:
             has_changes = True
         return has_changes
 
+    def _get_repo(self, git_uri: str, network_dir: Path) -> Repo:
+        repo = self._repos.get(network_dir)
+        if repo is None or repo.git_uri != git_uri:
+            repo = Repo(git_uri, str(network_dir))
+            self._repos[network_dir] = repo
+        return repo
+
     def needs_reload_git(self):
         """
         Check if any Git-based network configurations have updates.
@@ -488,7 +498,7 @@ class NetworkConfigLoader:
                 if network.config_type == ConfigTypes.GIT and network.git_repo:
                     if network_path.exists():
                         try:
-                            repo = Repo(network.git_repo, str(network_path))
+                            repo = self._get_repo(network.git_repo, network_path)
                             needs_update = repo.needs_update()
 
                             if needs_update:
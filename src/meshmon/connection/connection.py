@@ -1,7 +1,7 @@
 import queue
 import threading
 import time
-from typing import Literal, Protocol
+from typing import Callable, Literal, Protocol
 
 import structlog
 
@@ -17,7 +17,10 @@ from meshmon.prom_export import (
 from ..config.bus import ConfigBus, ConfigPreprocessor
 from ..config.config import Config
 from .grpc_types import Heartbeat, HeartbeatResponse, StoreUpdate
-from .proto import PacketData
+from .proto import PacketData, ProtocolData
+
+# Upper bound on packets coalesced into one PacketBatch frame
+PACKET_BATCH_SIZE = 32
 
 
 class ConnManConfigPreprocessor(ConfigPreprocessor[list[tuple[str, str]]]):
@@ -34,7 +37,7 @@ class ConnManConfigPreprocessor(ConfigPreprocessor[list[tuple[str, str]]]):
 class ProtocolHandler(Protocol):
     def build_packet(
         self, data: StoreUpdate | Heartbeat | HeartbeatResponse
-    ) -> PacketData | None: ...
+    ) -> ProtocolData | None: ...
 
     def handle_packet(self, request: PacketData, conn: "RawConnection") -> None: ...
 
@@ -47,10 +50,13 @@ class RawConnection:
         dest_node_id: str,
         initiator: Literal["local", "remote"],
     ):
-        self.stream_writer: queue.Queue[PacketData] = queue.Queue()
+        # None is queued on close to wake a blocked get_response
+        self.stream_writer: queue.Queue[ProtocolData | None] = queue.Queue()
         self.stream_reader: queue.Queue[PacketData] = queue.Queue()
         self.protocol = protocol
         self._closed = threading.Event()
+        # Set once get_batch has consumed the close sentinel mid-batch
+        self._sentinel_seen = False
         self.network_id = network_id
         self.dest_node_id = dest_node_id
         self.initiator = initiator
@@ -106,9 +112,12 @@ class RawConnection:
             )
             self.stream_reader.put(request)
 
-    def send_response(self, response: Heartbeat | HeartbeatResponse | StoreUpdate):
+    def send_response(
+        self, response: Heartbeat | HeartbeatResponse | StoreUpdate
+    ) -> bool:
+        """Queue a message for the peer; returns False if it was dropped."""
         if self._closed.is_set():
-            return
+            return False
         packet = self.protocol.build_packet(response)
         if packet:
             # Update queue depth metric
@@ -120,8 +129,14 @@ class RawConnection:
                 initiator=self.initiator,
             )
             self.stream_writer.put(packet)
+            return True
+        return False
 
-    def get_response(self, timeout: float | None = None) -> PacketData | None:
+    def get_response(self, timeout: float | None = None) -> ProtocolData | None:
+        """Wait for the next outbound packet.
+
+        Returns None on timeout or once the connection has been closed.
+        """
         self.wait_start = time.perf_counter_ns()
         try:
             result = self.stream_writer.get(timeout=timeout)
@@ -137,9 +152,42 @@ class RawConnection:
                     self.wait_start = self.last_scrape
                 self.total_wait_time += self.wait_end - self.wait_start
 
+    def get_batch(self, max_items: int = PACKET_BATCH_SIZE) -> ProtocolData | None:
+        """Wait for the next outbound packet and coalesce any already queued.
+
+        Several pending packets are merged into a single PacketBatch frame so
+        a burst costs one stream write instead of one per packet.
+        """
+        if self._sentinel_seen:
+            return None
+        first = self.get_response()
+        if first is None or not first.HasField("packet_data"):
+            return first
+        packets = [first.packet_data]
+        while len(packets) < max_items:
+            try:
+                pkt = self.stream_writer.get_nowait()
+            except queue.Empty:
+                break
+            if pkt is None:
+                # Flush this batch; the next call reports the close
+                self._sentinel_seen = True
+                break
+            packets.append(pkt.packet_data)
+        if len(packets) == 1:
+            return first
+        batch = ProtocolData()
+        batch.packet_batch.packets.extend(packets)
+        return batch
+
+    def packet_reader(self, batching: bool) -> Callable[[], ProtocolData | None]:
+        """Return the outbound reader matching the negotiated framing."""
+        return self.get_batch if batching else self.get_response
+
     def close(self):
         if not self._closed.is_set():
             self._closed.set()
+            self.stream_writer.put(None)
             record_connection_closed(
                 network_id=self.network_id,
                 node_id=self.dest_node_id,
@@ -190,6 +238,9 @@ class Connection:
         self.connections: list[RawConnection] = []
         self.conn_selector = 0
         self.conn_lock = threading.Lock()
+        # Bumped whenever a raw connection is added or removed, so senders
+        # can tell the peer may have missed messages queued on a dead stream
+        self.generation = 0
 
     def close(self):
         with self.conn_lock:
@@ -201,22 +252,26 @@ class Connection:
     def is_active(self) -> bool:
         return any(not conn.is_closed for conn in self.connections)
 
-    def send_response(self, response: Heartbeat | HeartbeatResponse | StoreUpdate):
+    def send_response(
+        self, response: Heartbeat | HeartbeatResponse | StoreUpdate
+    ) -> bool:
         with self.conn_lock:
             if len(self.connections) == 0:
-                return
+                return False
             self.conn_selector += 1
             self.conn_selector %= len(self.connections)
-            self.connections[self.conn_selector].send_response(response)
+            return self.connections[self.conn_selector].send_response(response)
 
     def add_raw_connection(self, raw_conn: RawConnection) -> None:
         with self.conn_lock:
             self.connections.append(raw_conn)
+            self.generation += 1
 
     def remove_raw_connection(self, raw_conn: RawConnection) -> None:
         if raw_conn in self.connections:
             with self.conn_lock:
                 self.connections.remove(raw_conn)
+                self.generation += 1
                 raw_conn.close()
 
 
@@ -231,12 +286,12 @@ class ConnectionManagerConfigPreprocessor(
             # Build an index for peer lookup
             peers = {n.node_id: n for n in network.node_config}
             self_id = network.node_id
+            src = peers.get(self_id)
+            if src is None:
+                continue
             for dest_id, dest in peers.items():
                 if dest_id == self_id:
                     continue
-                src = peers.get(self_id)
-                if src is None:
-                    continue
                 # Check if src can dial dest
                 src_can_dial_dest = False
                 if dest.url:
@@ -267,6 +322,7 @@ class ConnectionManager:
         watcher.subscribe(self.reload)
         self.watcher = watcher
         self.connections: dict[tuple[str, str], Connection] = {}
+        self.subscribers: list[Callable[[Connection], None]] = []
         self.logger = structlog.get_logger().bind(
             module="meshmon.connection.connection", component="ConnectionManager"
         )
@@ -280,6 +336,11 @@ class ConnectionManager:
                 return None
             return self.connections[(node_id, network_id)]
 
+    def subscribe(self, callback: Callable[[Connection], None]) -> None:
+        """Register a callback invoked whenever a new connection is added."""
+        with self.lock:
+            self.subscribers.append(callback)
+
     def add_connection(
         self,
         dest_node_id: str,
@@ -288,9 +349,10 @@ class ConnectionManager:
     ) -> Connection:
         with self.lock:
             if (dest_node_id, network_id) not in self.connections:
-                self.connections[(dest_node_id, network_id)] = Connection(
-                    dest_node_id, src_node_id, network_id
-                )
+                connection = Connection(dest_node_id, src_node_id, network_id)
+                self.connections[(dest_node_id, network_id)] = connection
+                for callback in self.subscribers:
+                    callback(connection)
             return self.connections[(dest_node_id, network_id)]
 
     def remove_connection(self, node_id: str, network_id: str) -> None:
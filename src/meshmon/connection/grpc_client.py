@@ -1,5 +1,5 @@
-import os
 import queue
+import secrets
 import threading
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Iterator
@@ -28,6 +28,30 @@ if TYPE_CHECKING:
     from .grpc_server import GrpcUpdateHandlerContainer
 
 
+def find_metadata(metadata, *keys: str) -> str:
+    """Return the value of the first of ``keys`` present in gRPC metadata.
+
+    Scans the metadata tuple directly instead of materialising a dict.
+    """
+    for key in keys:
+        for md_key, value in metadata:
+            if md_key == key:
+                if isinstance(value, bytes):
+                    return value.decode("ascii", errors="ignore")
+                return value
+    return ""
+
+
+# Advertised by peers that can unpack PacketBatch frames
+PACKET_BATCH_METADATA = ("packet-batch", "1")
+
+
+def supports_batching(metadata) -> bool:
+    """Whether the peer's gRPC metadata advertises PacketBatch support."""
+    key, value = PACKET_BATCH_METADATA
+    return find_metadata(metadata, key) == value
+
+
 @dataclass
 class ClientTarget:
     verifier: Verifier
@@ -159,6 +183,7 @@ class GrpcClientManager:
                 channel = grpc.insecure_channel(
                     target.address,
                     options=options,
+                    compression=grpc.Compression.Gzip,
                 )
             else:
                 creds = grpc.ssl_channel_credentials()
@@ -166,6 +191,7 @@ class GrpcClientManager:
                     target.address,
                     creds,
                     options=options,
+                    compression=grpc.Compression.Gzip,
                 )
             stub = MeshMonServiceStub(channel)
 
@@ -294,6 +320,7 @@ class GrpcClient:
         self.raw_conn: RawConnection | None = None
         self._send_queue: "queue.Queue[ProtocolData]" = queue.Queue()
         self._client_nonce: str | None = None
+        self._batching = False
         self._call: grpc.Call | None = None
 
     def stop_stream(self):
@@ -315,24 +342,26 @@ class GrpcClient:
                 yield item
             except queue.Empty:
                 pass
-        while not self.stop_event.is_set():
-            if (
-                self.connection_active.is_set()
-                and self.raw_conn is not None
-                and not self.raw_conn.is_closed
-            ):
-                pkt = self.raw_conn.get_response(timeout=0.1)
-                if pkt is not None:
-                    yield ProtocolData(packet_data=pkt)
+        raw_conn = self.raw_conn
+        if self.stop_event.is_set() or raw_conn is None:
+            return
+        next_response = raw_conn.packet_reader(self._batching)
+        # Blocks until a packet is queued; closing the raw connection wakes it
+        while True:
+            pkt = next_response()
+            if pkt is None:
+                return
+            yield pkt
 
     def stream_worker(self):
         connection = None
         try:
             # Start the bidi stream with client nonce as metadata
-            client_nonce = os.urandom(256).hex()
+            client_nonce = secrets.token_hex(32)
             self._client_nonce = client_nonce
             response_iterator = self.stub.StreamUpdates(
-                self.request_generator(), metadata=(("client-nonce", client_nonce),)
+                self.request_generator(),
+                metadata=(("client-nonce", client_nonce), PACKET_BATCH_METADATA),
             )
             # Track the underlying call to allow client-side abort/cancel
             try:
@@ -354,15 +383,13 @@ class GrpcClient:
                 return
 
             try:
-                md = dict(response_iterator.initial_metadata())
+                initial_metadata = response_iterator.initial_metadata()
+                server_nonce = find_metadata(
+                    initial_metadata, "server-nonce", "server_nonce"
+                )
+                self._batching = supports_batching(initial_metadata)
             except Exception:
-                md = {}
-            server_nonce = md.get("server-nonce", md.get("server_nonce"))
-            if isinstance(server_nonce, bytes):
-                try:
-                    server_nonce = server_nonce.decode("ascii", errors="ignore")
-                except Exception:
-                    server_nonce = None  # type: ignore[assignment]
+                server_nonce = ""
             if not server_nonce:
                 self.logger.warning(
                     "Missing server-nonce in initial metadata",
@@ -379,7 +406,7 @@ class GrpcClient:
                 node_id=self.self_node_id,
             )
             client_sbd = SignedBlockData.new(
-                self.signer, client_validator, "validator", "validator"
+                self.signer, client_validator.to_dict(), "validator", "validator"
             )
             self._send_queue.put(
                 ProtocolData(
@@ -403,7 +430,7 @@ class GrpcClient:
                 server_sbd = SignedBlockData.model_validate_json(
                     first_resp.connection_validation.validator
                 )
-                server_validator = Validator.model_validate(server_sbd.data)
+                server_validator = Validator.from_dict(server_sbd.data)
             except Exception as e:
                 self.logger.warning("Failed to parse server validator", error=str(e))
                 self.stop_stream()
@@ -411,7 +438,9 @@ class GrpcClient:
 
             # Verify server's response
             if (
-                not server_sbd.verify(self.verifier, "validator", "validator")
+                not server_sbd.verify(
+                    self.verifier, "validator", "validator", cache=False
+                )
                 or server_validator.local_nonce != server_nonce
                 or server_validator.remote_nonce != client_nonce
                 or server_validator.network_id != self.network_id
@@ -474,21 +503,31 @@ class GrpcClient:
             self.connection_active.set()
 
             # Main receive loop
+            raw_conn = self.raw_conn
+            handle_request = raw_conn.handle_request
             for resp in response_iterator:
-                if self.raw_conn.is_closed:
+                if raw_conn.is_closed:
                     break
                 if resp is None:
                     break
-                if resp.HasField("packet_data") and self.raw_conn is not None:
-                    self.raw_conn.handle_request(resp.packet_data)
+                message_type = resp.WhichOneof("message_type")
+                if message_type == "packet_data":
+                    handle_request(resp.packet_data)
+                elif message_type == "packet_batch":
+                    for packet in resp.packet_batch.packets:
+                        handle_request(packet)
 
             self.logger.info(
                 "gRPC Bidirectional stream to server closed",
                 dest_node_id=self.peer_node_id,
             )
         except grpc.RpcError as e:
-            # Connection errors are expected during startup/reconnect
-            if e.code() == grpc.StatusCode.UNAVAILABLE:  # type: ignore
+            # Connection errors are expected during startup/reconnect, and the
+            # server cancels streams it closes itself
+            if e.code() in (  # type: ignore
+                grpc.StatusCode.UNAVAILABLE,
+                grpc.StatusCode.CANCELLED,
+            ):
                 self.logger.debug(
                     "Connection unavailable",
                     node_id=self.peer_node_id,
@@ -519,3 +558,5 @@ class GrpcClient:
                     connection.remove_raw_connection(self.raw_conn)
             except Exception:
                 pass
+            if self.raw_conn is not None:
+                self.raw_conn.close()
@@ -1,4 +1,4 @@
-import os
+import secrets
 import threading
 from concurrent import futures
 from dataclasses import dataclass
@@ -19,7 +19,12 @@ from ..connection.update_handler import GrpcUpdateHandler
 from ..pulsewave.crypto import Signer, Verifier
 from ..pulsewave.data import SignedBlockData
 from .connection import ConnectionManager, RawConnection
-from .grpc_client import GrpcClientManager
+from .grpc_client import (
+    PACKET_BATCH_METADATA,
+    GrpcClientManager,
+    find_metadata,
+    supports_batching,
+)
 from .grpc_types import Validator
 from .proto import (
     ConnectionValidation,
@@ -39,12 +44,16 @@ class GrpcUpdateHandlerContainer:
         self.connection_manager = connection_manager
 
     def get_handler(self, network_id: str) -> GrpcUpdateHandler:
+        # Handlers are only created once per network, so skip the lock when cached
+        handler = self.handlers.get(network_id)
+        if handler is not None:
+            return handler
         with self.lock:
-            if network_id not in self.handlers:
-                self.handlers[network_id] = GrpcUpdateHandler(
-                    network_id, self.connection_manager
-                )
-            return self.handlers[network_id]
+            handler = self.handlers.get(network_id)
+            if handler is None:
+                handler = GrpcUpdateHandler(network_id, self.connection_manager)
+                self.handlers[network_id] = handler
+            return handler
 
     def remove_handler(self, network_id: str) -> None:
         with self.lock:
@@ -56,11 +65,15 @@ class GrpcUpdateHandlerContainer:
 class ServerConfig:
     verifiers: dict[tuple[str, str], Verifier]
     server_signers: dict[str, Signer]
+    # Per-network Validator fields; only the nonces differ between handshakes
+    validator_templates: dict[str, dict[str, str]]
 
 
 class ServerConfigPreprocessor(ConfigPreprocessor[ServerConfig]):
     def preprocess(self, config: Config | None) -> ServerConfig:
-        server_config = ServerConfig(verifiers={}, server_signers={})
+        server_config = ServerConfig(
+            verifiers={}, server_signers={}, validator_templates={}
+        )
         if config is None:
             return server_config
         for network_id, network in config.networks.items():
@@ -70,6 +83,12 @@ class ServerConfigPreprocessor(ConfigPreprocessor[ServerConfig]):
             for node, verifier in network.key_mapping.verifiers.items():
                 server_config.verifiers[(network_id, node)] = verifier
             server_config.server_signers[network_id] = network.key_mapping.signer
+            server_config.validator_templates[network_id] = Validator(
+                local_nonce="",
+                remote_nonce="",
+                network_id=network_id,
+                node_id=network.key_mapping.signer.node_id,
+            ).to_dict()
         return server_config
 
 
@@ -82,6 +101,7 @@ class MeshMonServicer(MeshMonServiceServicer):
         update_handlers: GrpcUpdateHandlerContainer,
         config_watcher: ConfigWatcher[ServerConfig],
         config_bus: ConfigBus,
+        max_streams: int = 20,
     ):
         self.config_bus = config_bus
         self.config_watcher = config_watcher
@@ -93,6 +113,16 @@ class MeshMonServicer(MeshMonServiceServicer):
         self.connection_manager = connection_manager
         self.conn_lock = threading.Lock()
         self.update_handlers = update_handlers
+        # A reader can briefly outlive its stream's server worker, so leave
+        # headroom for closing streams while new ones start
+        self.reader_pool = futures.ThreadPoolExecutor(
+            max_workers=max_streams * 2, thread_name_prefix="grpc-server-request"
+        )
+
+    @staticmethod
+    def decode_validation(raw: str) -> tuple[SignedBlockData, Validator]:
+        sbd = SignedBlockData.model_validate_json(raw)
+        return sbd, Validator.from_dict(sbd.data)
 
     def request_handler(
         self,
@@ -101,14 +131,19 @@ class MeshMonServicer(MeshMonServiceServicer):
         verifier: Verifier,
     ):
         """Handle incoming requests in a separate thread."""
+        handle_request = raw_conn.handle_request
         try:
             for request in request_iterator:
                 if request is None:
                     break
                 if raw_conn.is_closed:
                     break
-                if request.HasField("packet_data"):
-                    raw_conn.handle_request(request.packet_data)
+                message_type = request.WhichOneof("message_type")
+                if message_type == "packet_data":
+                    handle_request(request.packet_data)
+                elif message_type == "packet_batch":
+                    for packet in request.packet_batch.packets:
+                        handle_request(packet)
                 else:
                     self.logger.warning(
                         "Received unknown request type, ignoring",
@@ -116,9 +151,11 @@ class MeshMonServicer(MeshMonServiceServicer):
                     )
 
         except Exception as e:
-            self.logger.error(
-                "Request handler error for", node_id=verifier.node_id, error=e
-            )
+            # Cancelling a stream we already closed ends the iterator with an error
+            if not raw_conn.is_closed:
+                self.logger.error(
+                    "Request handler error for", node_id=verifier.node_id, error=e
+                )
         finally:
             raw_conn.close()
 
@@ -127,16 +164,17 @@ class MeshMonServicer(MeshMonServiceServicer):
     ) -> Iterator[ProtocolData]:
         """Handle truly bidirectional streaming for mesh updates."""
         # The returns after the aborts are needed to statically satisfy the type checker
-        server_nonce = os.urandom(256).hex()
+        server_nonce = secrets.token_hex(32)
         # Use hyphenated metadata names; underscores may be dropped by proxies
-        context.send_initial_metadata((("server-nonce", server_nonce),))
-        meta = dict(context.invocation_metadata())
-        client_nonce = meta.get("client-nonce", meta.get("client_nonce", ""))
-        if isinstance(client_nonce, bytes):
-            try:
-                client_nonce = client_nonce.decode("ascii", errors="ignore")
-            except Exception:
-                client_nonce = ""
+        context.send_initial_metadata(
+            (("server-nonce", server_nonce), PACKET_BATCH_METADATA)
+        )
+        invocation_metadata = context.invocation_metadata()
+        client_nonce = find_metadata(
+            invocation_metadata, "client-nonce", "client_nonce"
+        )
+        # Only coalesce outbound packets for clients that can unpack batches
+        batching = supports_batching(invocation_metadata)
         if not client_nonce:
             self.logger.warning(
                 "Missing or invalid client_nonce in metadata", peer=context.peer()
@@ -159,11 +197,10 @@ class MeshMonServicer(MeshMonServiceServicer):
             )
             return
         try:
-            conn_init_sbd = SignedBlockData.model_validate_json(
+            conn_init_sbd, client_validator = self.decode_validation(
                 initial_packet.connection_validation.validator
             )
-            client_validator = Validator.model_validate(conn_init_sbd.data)
-        except ValidationError as e:
+        except (ValidationError, KeyError, TypeError) as e:
             self.logger.warning(
                 "Failed to parse ConnectionValidation during gRPC stream initialization",
                 error=str(e),
@@ -172,15 +209,16 @@ class MeshMonServicer(MeshMonServiceServicer):
                 grpc.StatusCode.UNAUTHENTICATED, "Invalid ConnectionValidation format"
             )
             return
+        network_id = client_validator.network_id
+        client_node_id = client_validator.node_id
         try:
-            verifier = self.config.verifiers.get(
-                (client_validator.network_id, client_validator.node_id)
-            )
-            if not verifier:
+            verifier = self.config.verifiers.get((network_id, client_node_id))
+            signer = self.config.server_signers.get(network_id)
+            if not verifier or not signer:
                 self.logger.warning(
                     "No verifier found for node during gRPC connection",
-                    node_id=client_validator.node_id,
-                    network_id=client_validator.network_id,
+                    node_id=client_node_id,
+                    network_id=network_id,
                     peer=context.peer(),
                 )
                 context.abort(
@@ -188,27 +226,27 @@ class MeshMonServicer(MeshMonServiceServicer):
                 )
                 return
             if (
-                not conn_init_sbd.verify(verifier, "validator", "validator")
+                not conn_init_sbd.verify(
+                    verifier, "validator", "validator", cache=False
+                )
                 or client_validator.remote_nonce != server_nonce
                 or client_validator.local_nonce != client_nonce
             ):
                 self.logger.warning(
                     "Client failed server challenge",
-                    node_id=client_validator.node_id,
-                    network_id=client_validator.network_id,
+                    node_id=client_node_id,
+                    network_id=network_id,
                     peer=context.peer(),
                 )
                 context.abort(
                     grpc.StatusCode.UNAUTHENTICATED, "Client failed server challenge"
                 )
                 return
-            signer = self.config.server_signers[client_validator.network_id]
             server_node_id = signer.node_id
-            server_validator = Validator(
-                remote_nonce=client_nonce,
+            server_validator = dict(
+                self.config.validator_templates[network_id],
                 local_nonce=server_nonce,
-                node_id=server_node_id,
-                network_id=client_validator.network_id,
+                remote_nonce=client_nonce,
             )
             validator = SignedBlockData.new(
                 signer, server_validator, "validator", "validator"
@@ -225,8 +263,8 @@ class MeshMonServicer(MeshMonServiceServicer):
                 return
             self.logger.error(
                 "Error during gRPC stream initialization",
-                node_id=client_validator.node_id,
-                network_id=client_validator.network_id,
+                node_id=client_node_id,
+                network_id=network_id,
                 peer=context.peer(),
                 exc=e,
             )
@@ -234,8 +272,6 @@ class MeshMonServicer(MeshMonServiceServicer):
                 grpc.StatusCode.UNAUTHENTICATED, "Error during authentication"
             )
             return
-        network_id = client_validator.network_id
-        client_node_id = client_validator.node_id
         watcher = self.config_bus.get_watcher(
             ConnectionConfigPreprocessor(network_id, client_node_id)
         )
@@ -279,16 +315,9 @@ class MeshMonServicer(MeshMonServiceServicer):
             )
             connection.add_raw_connection(raw_conn)
 
-        request_thread = threading.Thread(
-            target=self.request_handler,
-            args=(
-                request_iterator,
-                raw_conn,
-                verifier,
-            ),
-            name=f"grpc-server-request-{network_id}-{client_node_id}",
+        request_future = self.reader_pool.submit(
+            self.request_handler, request_iterator, raw_conn, verifier
         )
-        request_thread.start()
 
         self.logger.info(
             "gRPC Bidirectional stream connection from client established",
@@ -299,14 +328,15 @@ class MeshMonServicer(MeshMonServiceServicer):
         )
 
         try:
-            # Response  loop - yields responses as they become available
-            while not raw_conn.is_closed:
+            # Response loop - blocks until a response is queued or the
+            # connection is closed
+            next_response = raw_conn.packet_reader(batching)
+            while True:
                 try:
-                    # Wait for responses with timeout to check stop_event periodically
-                    response = raw_conn.get_response(0.5)
+                    response = next_response()
                     if response is None:
-                        continue
-                    yield ProtocolData(packet_data=response)
+                        break
+                    yield response
 
                 except Exception as e:
                     self.logger.error(
@@ -328,9 +358,14 @@ class MeshMonServicer(MeshMonServiceServicer):
             )
         finally:
             connection.remove_raw_connection(raw_conn)
-            # Wait for request thread to finish
-            if request_thread.is_alive():
-                request_thread.join(timeout=2.0)
+            # The reader only returns once the RPC ends, which would otherwise
+            # wait for this finally; cancel so it exits before we wait on it
+            if not request_future.done():
+                context.cancel()
+            try:
+                request_future.result(timeout=2.0)
+            except futures.TimeoutError:
+                pass
 
             self.logger.info(
                 "gRPC Bidirectional stream connection closed",
@@ -348,6 +383,9 @@ class MeshMonServicer(MeshMonServiceServicer):
         self.config = new_config
         self.logger.debug("MeshMonServicer config updated successfully")
 
+    def shutdown(self) -> None:
+        self.reader_pool.shutdown(wait=False, cancel_futures=True)
+
 
 class GrpcServer:
     """gRPC server for handling mesh connections."""
@@ -358,6 +396,7 @@ class GrpcServer:
             module="meshmon.connection.grpc_server", component="GrpcServer"
         )
         self.server = None
+        self.servicer: MeshMonServicer | None = None
         self.connection_manager = ConnectionManager(config_bus)
         self.update_handlers = GrpcUpdateHandlerContainer(self.connection_manager)
         self._client = None  # Embedded client instance
@@ -365,12 +404,12 @@ class GrpcServer:
     def get_handler(self, network_id: str) -> GrpcUpdateHandler:
         return self.update_handlers.get_handler(network_id)
 
-    def start(self, port: int = 42069) -> bool:
+    def start(self, port: int = 42069, max_workers: int = 20) -> bool:
         """Start the gRPC server."""
         try:
             # Create server with thread pool
             self.server = grpc.server(
-                futures.ThreadPoolExecutor(max_workers=20),
+                futures.ThreadPoolExecutor(max_workers=max_workers),
                 options=[
                     ("grpc.keepalive_time_ms", 10000),
                     ("grpc.keepalive_timeout_ms", 5000),
@@ -379,16 +418,22 @@ class GrpcServer:
                     ("grpc.http2.min_time_between_pings_ms", 10000),
                     ("grpc.http2.min_ping_interval_without_data_ms", 300000),
                 ],
+                # Store updates are signed JSON and compress well
+                compression=grpc.Compression.Gzip,
             )
 
             # Add the servicer
             watcher = self.config_bus.get_watcher(ServerConfigPreprocessor())
             if watcher is None:
                 raise RuntimeError("Failed to initialize server")
-            servicer = MeshMonServicer(
-                self.connection_manager, self.update_handlers, watcher, self.config_bus
+            self.servicer = MeshMonServicer(
+                self.connection_manager,
+                self.update_handlers,
+                watcher,
+                self.config_bus,
+                max_streams=max_workers,
             )
-            add_MeshMonServiceServicer_to_server(servicer, self.server)
+            add_MeshMonServiceServicer_to_server(self.servicer, self.server)
 
             # Add insecure port (TODO: add TLS support)
             listen_ip6addr = f"[::]:{port}"
@@ -427,6 +472,8 @@ class GrpcServer:
 
             # Stop server gracefully
             self.server.stop(grace_period)
+            if self.servicer:
+                self.servicer.shutdown()
 
             # Stop embedded client
             try:
@@ -1,20 +1,61 @@
-from pydantic import BaseModel
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Self
 
+import pydantic_core
 
-class Validator(BaseModel):
+
+class _Message:
+    """Plain slotted message with a compact JSON encoding.
+
+    These are built and serialized for every packet, so they skip pydantic
+    validation entirely and only use its Rust JSON codec; field presence is
+    still enforced on decode.
+    """
+
+    __slots__ = ()
+    # Generated by @dataclass on each subclass; lists the __init__ fields
+    __match_args__: ClassVar[tuple[str, ...]]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__match_args__}
+
+    def to_json(self) -> bytes:
+        return pydantic_core.to_json(self.to_dict())
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        return cls(*(data[name] for name in cls.__match_args__))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> Self:
+        return cls.from_dict(pydantic_core.from_json(data))
+
+
+@dataclass(slots=True)
+class Validator(_Message):
     local_nonce: str
     remote_nonce: str
     network_id: str
     node_id: str
 
 
-class Heartbeat(BaseModel):
+@dataclass(slots=True)
+class Heartbeat(_Message):
     node_time: int
 
 
-class HeartbeatResponse(BaseModel):
+@dataclass(slots=True)
+class HeartbeatResponse(_Message):
     node_time: int
 
 
-class StoreUpdate(BaseModel):
+@dataclass(slots=True)
+class StoreUpdate(_Message):
     data: str
+    # One update is broadcast to every peer, so encode the dump only once
+    _json: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    def to_json(self) -> bytes:
+        if self._json is None:
+            self._json = _Message.to_json(self)
+        return self._json
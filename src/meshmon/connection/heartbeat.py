@@ -1,6 +1,8 @@
 import datetime
+import heapq
 import threading
 import time
+from collections.abc import KeysView
 from dataclasses import dataclass
 
 import structlog
@@ -9,31 +11,39 @@ from ..config.bus import ConfigBus, ConfigPreprocessor
 from ..config.config import Config, LoadedNetworkNodeInfo
 from ..distrostore import StoreManager
 from ..dstypes import DSObjectStatus, DSPingData
-from .connection import ConnectionManager
+from .connection import Connection, ConnectionManager
 from .grpc_types import Heartbeat
 
+# How long to wait before retrying a connection that has no heartbeat config
+# yet, and the ping sweep interval when no peers are configured
+PING_SCAN_INTERVAL = 2.0
+
 
 @dataclass
 class HeartbeatConfig:
     """Configuration for heartbeat controller"""
 
     node_configs: dict[
-        tuple[str, str], LoadedNetworkNodeInfo
-    ]  # (network_id, node_id) -> NetworkNodeInfo
+        str, dict[str, LoadedNetworkNodeInfo]
+    ]  # network_id -> node_id -> NetworkNodeInfo
 
 
 class HeartbeatConfigPreprocessor(ConfigPreprocessor[HeartbeatConfig]):
     def preprocess(self, config: Config | None) -> HeartbeatConfig:
-        node_configs = {}
         if config is None:
-            return HeartbeatConfig(node_configs=node_configs)
-        for network_id, network in config.networks.items():
-            for node in network.node_config:
-                if node.node_id == network.node_id:
-                    continue
-                node_configs[(network_id, node.node_id)] = node
-
-        return HeartbeatConfig(node_configs=node_configs)
+            return HeartbeatConfig(node_configs={})
+        # allow/block only gate who dials whom; peers connecting in the other
+        # direction still need heartbeats, so they are not filtered here
+        return HeartbeatConfig(
+            node_configs={
+                network_id: {
+                    node.node_id: node
+                    for node in network.node_config
+                    if node.node_id != network.node_id
+                }
+                for network_id, network in config.networks.items()
+            }
+        )
 
 
 class HeartbeatController:
@@ -53,58 +63,95 @@ class HeartbeatController:
             raise ValueError("No initial config available for heartbeat controller")
         self.config_watcher = watcher
         self.config = watcher.current_config
+        self._ping_scan_interval = self._scan_interval(self.config)
         watcher.subscribe(self.reload)
         self.store_manager = store
         self.stop_event = threading.Event()
-        self.last_sent: dict[tuple[str, str], float] = {}
+        # send_response serializes synchronously, so one message can be reused
+        self._heartbeat = Heartbeat(node_time=0)
+        # Min-heap of (next_due, network_id, dest_node_id)
+        self._due: list[tuple[float, str, str]] = []
+        self._scheduled: set[tuple[str, str]] = set()
+        self._due_lock = threading.Lock()
+        # Set when the heap head may have moved earlier, to cut the sleep short
+        self._wakeup = threading.Event()
+        connection_manager.subscribe(self.schedule)
+        for connection in connection_manager:
+            self.schedule(connection)
 
     def get_node_config(self, network: str, node_id: str):
-        return self.config.node_configs.get((network, node_id))
-
-    def needs_heartbeat(self, network: str, dest_node_id: str) -> bool:
-        last_sent = self.last_sent.get((network, dest_node_id), 0)
-        nodes_config = self.get_node_config(network, dest_node_id)
-        if not nodes_config:
-            return False
-        return time.time() - last_sent > nodes_config.poll_rate
-
-    def filter_config(self, network_id: str) -> list[str]:
-        filtered_configs = [
-            value
-            for net_id, value in self.config.node_configs.keys()
-            if net_id == network_id
+        network_configs = self.config.node_configs.get(network)
+        return network_configs.get(node_id) if network_configs else None
+
+    def schedule(self, connection: Connection) -> None:
+        """Queue an immediate heartbeat for a newly added connection."""
+        key = (connection.network, connection.dest_node_id)
+        with self._due_lock:
+            if key in self._scheduled:
+                return
+            self._scheduled.add(key)
+            heapq.heappush(self._due, (time.monotonic(), *key))
+        self._wakeup.set()
+
+    def _pop_due(self, now: float) -> list[tuple[str, str]]:
+        due = []
+        with self._due_lock:
+            while self._due and self._due[0][0] <= now:
+                _, network, dest_node_id = heapq.heappop(self._due)
+                due.append((network, dest_node_id))
+        return due
+
+    def _push(self, due: float, network: str, dest_node_id: str) -> None:
+        with self._due_lock:
+            heapq.heappush(self._due, (due, network, dest_node_id))
+
+    def _unschedule(self, network: str, dest_node_id: str) -> None:
+        with self._due_lock:
+            self._scheduled.discard((network, dest_node_id))
+        # A reload may have re-added the peer after the caller saw it gone,
+        # while schedule() still found the key and skipped it
+        connection = self.connection_manager.get_connection(dest_node_id, network)
+        if connection is not None:
+            self.schedule(connection)
+
+    def _next_wakeup(self, now: float, next_ping_scan: float) -> float:
+        with self._due_lock:
+            next_due = self._due[0][0] if self._due else next_ping_scan
+        return max(0.0, min(next_due, next_ping_scan) - now)
+
+    @staticmethod
+    def _scan_interval(config: HeartbeatConfig) -> float:
+        """Sweep ping data at half the fastest poll rate, at most once a second."""
+        poll_rates = [
+            node.poll_rate
+            for network_configs in config.node_configs.values()
+            for node in network_configs.values()
         ]
-        return filtered_configs
+        if not poll_rates:
+            return PING_SCAN_INTERVAL
+        return max(1.0, min(poll_rates) / 2)
+
+    def filter_config(self, network_id: str) -> KeysView[str]:
+        return self.config.node_configs.get(network_id, {}).keys()
 
     def set_ping_status(self):
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        alive_connections = {
+            conn.dest_node_id for conn in self.connection_manager if conn.is_active
+        }
         for network_id, store in self.store_manager.stores.items():
             node_ctx = store.get_context("ping_data", DSPingData)
-            alive_connections = [
-                conn.dest_node_id for conn in self.connection_manager if conn.is_active
-            ]
-            for node_id in alive_connections:
-                if node_id not in node_ctx:
-                    now = datetime.datetime.now(tz=datetime.timezone.utc)
-                    node_ctx.set(
-                        node_id,
-                        DSPingData(
-                            status=DSObjectStatus.UNKNOWN, req_time_rtt=-1, date=now
-                        ),
-                    )
-            for node_id, ping_data in node_ctx:
-                nodes_config = self.get_node_config(network_id, node_id)
+            # Snapshot so each entry is parsed once while the sweep mutates it
+            existing = dict(node_ctx.snapshot())
+            network_configs = self.config.node_configs.get(network_id, {})
+            for node_id, ping_data in existing.items():
+                nodes_config = network_configs.get(node_id)
                 if not nodes_config or node_id not in alive_connections:
-                    uid = (network_id, node_id)
-                    if uid in self.last_sent:
-                        del self.last_sent[uid]
                     node_ctx.delete(node_id)
                     continue
 
-                now = datetime.datetime.now(tz=datetime.timezone.utc)
                 if (
-                    (
-                        datetime.datetime.now(tz=datetime.timezone.utc) - ping_data.date
-                    ).total_seconds()
+                    (now - ping_data.date).total_seconds()
                     > nodes_config.poll_rate * nodes_config.retry
                     and ping_data.status != DSObjectStatus.OFFLINE
                 ):
@@ -116,17 +163,43 @@ class HeartbeatController:
                             date=now,
                         ),
                     )
+            # Unconfigured peers would be dropped by the next sweep, so only
+            # seed entries for the ones that stay
+            for node_id in (
+                network_configs.keys() & alive_connections
+            ) - existing.keys():
+                node_ctx.set(
+                    node_id,
+                    DSPingData(
+                        status=DSObjectStatus.UNKNOWN, req_time_rtt=-1, date=now
+                    ),
+                )
 
     def heartbeat_loop(self) -> None:
+        heartbeat = self._heartbeat
+        next_ping_scan = 0.0
         while True:
-            for connection in self.connection_manager:
-                if self.needs_heartbeat(connection.network, connection.dest_node_id):
-                    connection.send_response(Heartbeat(node_time=time.time_ns()))
-                    self.last_sent[(connection.network, connection.dest_node_id)] = (
-                        time.time()
-                    )
-            self.set_ping_status()
-            if self.stop_event.wait(2):
+            now = time.monotonic()
+            for network, dest_node_id in self._pop_due(now):
+                connection = self.connection_manager.get_connection(
+                    dest_node_id, network
+                )
+                if connection is None:
+                    self._unschedule(network, dest_node_id)
+                    continue
+                nodes_config = self.get_node_config(network, dest_node_id)
+                if not nodes_config:
+                    self._push(now + PING_SCAN_INTERVAL, network, dest_node_id)
+                    continue
+                heartbeat.node_time = time.time_ns()
+                connection.send_response(heartbeat)
+                self._push(now + nodes_config.poll_rate, network, dest_node_id)
+            if now >= next_ping_scan:
+                self.set_ping_status()
+                next_ping_scan = now + self._ping_scan_interval
+            self._wakeup.wait(self._next_wakeup(time.monotonic(), next_ping_scan))
+            self._wakeup.clear()
+            if self.stop_event.is_set():
                 break
 
     def start(self) -> None:
@@ -137,19 +210,21 @@ class HeartbeatController:
 
     def stop(self) -> None:
         self.stop_event.set()
+        self._wakeup.set()
         self.thread.join()
 
     def reload(self, new_config: HeartbeatConfig) -> None:
+        old_node_count = sum(map(len, self.config.node_configs.values()))
+        new_node_count = sum(map(len, new_config.node_configs.values()))
         self.logger.info(
             "Config reload triggered for HeartbeatController",
-            new_node_count=len(new_config.node_configs),
-            old_node_count=len(self.config.node_configs),
+            new_node_count=new_node_count,
+            old_node_count=old_node_count,
         )
-        nodes = len(self.config.node_configs)
         self.config = new_config
-        removed_count = nodes - len(self.config.node_configs)
+        self._ping_scan_interval = self._scan_interval(new_config)
 
         self.logger.debug(
             "HeartbeatController config updated successfully",
-            removed_entries=removed_count,
+            removed_entries=old_node_count - new_node_count,
         )
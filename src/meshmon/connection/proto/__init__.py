@@ -6,6 +6,7 @@ This module contains the generated protobuf classes and gRPC stubs.
 
 from .meshmon_pb2 import (
     ConnectionValidation,
+    PacketBatch,
     PacketData,
     ProtocolData,
 )
@@ -18,6 +19,7 @@ from .meshmon_pb2_grpc import (
 __all__ = [
     # Message types
     "ConnectionValidation",
+    "PacketBatch",
     "PacketData",
     "ProtocolData",
     # gRPC types
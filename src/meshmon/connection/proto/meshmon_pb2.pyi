@@ -1,3 +1,4 @@
+from collections.abc import Iterable as _Iterable
 from collections.abc import Mapping as _Mapping
 from typing import ClassVar as _ClassVar
 from typing import Optional as _Optional
@@ -5,19 +6,23 @@ from typing import Union as _Union
 
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
+from google.protobuf.internal import containers as _containers
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class ProtocolData(_message.Message):
-    __slots__ = ("packet_data", "connection_validation")
+    __slots__ = ("packet_data", "connection_validation", "packet_batch")
     PACKET_DATA_FIELD_NUMBER: _ClassVar[int]
     CONNECTION_VALIDATION_FIELD_NUMBER: _ClassVar[int]
+    PACKET_BATCH_FIELD_NUMBER: _ClassVar[int]
     packet_data: PacketData
     connection_validation: ConnectionValidation
+    packet_batch: PacketBatch
     def __init__(
         self,
         packet_data: _Optional[_Union[PacketData, _Mapping]] = ...,
         connection_validation: _Optional[_Union[ConnectionValidation, _Mapping]] = ...,
+        packet_batch: _Optional[_Union[PacketBatch, _Mapping]] = ...,
     ) -> None: ...
 
 class PacketData(_message.Message):
@@ -26,15 +31,23 @@ class PacketData(_message.Message):
     DATA_FIELD_NUMBER: _ClassVar[int]
     VALIDATOR_FIELD_NUMBER: _ClassVar[int]
     packet_id: str
-    data: str
+    data: bytes
     validator: str
     def __init__(
         self,
         packet_id: _Optional[str] = ...,
-        data: _Optional[str] = ...,
+        data: _Optional[bytes] = ...,
         validator: _Optional[str] = ...,
     ) -> None: ...
 
+class PacketBatch(_message.Message):
+    __slots__ = ("packets",)
+    PACKETS_FIELD_NUMBER: _ClassVar[int]
+    packets: _containers.RepeatedCompositeFieldContainer[PacketData]
+    def __init__(
+        self, packets: _Optional[_Iterable[_Union[PacketData, _Mapping]]] = ...
+    ) -> None: ...
+
 class ConnectionValidation(_message.Message):
     __slots__ = ("validator",)
     VALIDATOR_FIELD_NUMBER: _ClassVar[int]
@@ -1,5 +1,7 @@
+import hashlib
 import time
 from dataclasses import dataclass
+from typing import Callable
 
 from structlog import get_logger
 
@@ -16,9 +18,14 @@ from ..pulsewave.crypto import Signer, Verifier
 from ..pulsewave.data import SignedBlockData
 from .connection import ProtocolHandler, RawConnection
 from .grpc_types import Heartbeat, HeartbeatResponse, StoreUpdate, Validator
-from .proto import PacketData
+from .proto import PacketData, ProtocolData
 from .update_handler import GrpcUpdateHandler
 
+# PacketData.packet_id values
+PACKET_STORE_UPDATE = "store_update"
+PACKET_HEARTBEAT = "heartbeat"
+PACKET_HEARTBEAT_RESPONSE = "heartbeat_response"
+
 
 @dataclass
 class ConnectionConfig:
@@ -74,6 +81,11 @@ class PulseWaveProtocol(ProtocolHandler):
         self.local_nonce = local_nonce
         self.handler = handler
         self.mr_sbd = mr_sbd
+        self._dispatch: dict[str, Callable[[bytes, RawConnection], None]] = {
+            PACKET_STORE_UPDATE: self._handle_store_update,
+            PACKET_HEARTBEAT: self._handle_heartbeat,
+            PACKET_HEARTBEAT_RESPONSE: self._handle_heartbeat_response,
+        }
         self.logger = get_logger().bind(
             module="meshmon.connection.protocol_handler", component="PulseWaveProtocol"
         )
@@ -96,6 +108,8 @@ class PulseWaveProtocol(ProtocolHandler):
             network_id=config.network_id,
             node_id=config.signer.node_id,
         )
+        # Signed into every outbound validator; only changes on reload
+        self._send_nonce_data = self.send_nonce.to_dict()
 
         self.recv_nonce = Validator(
             local_nonce=self.remote_nonce,
@@ -103,6 +117,9 @@ class PulseWaveProtocol(ProtocolHandler):
             network_id=config.network_id,
             node_id=config.verifier.node_id,
         )
+        self._recv_nonce_data = self.recv_nonce.to_dict()
+        # New keys may accept entries a previous identical payload could not
+        self._last_update_digest: bytes | None = None
         self.logger.debug(
             "PulseWaveProtocol config updated successfully",
             network_id=config.network_id,
@@ -110,37 +127,30 @@ class PulseWaveProtocol(ProtocolHandler):
 
     def build_packet(
         self, data: StoreUpdate | Heartbeat | HeartbeatResponse
-    ) -> PacketData | None:
-        verifier = SignedBlockData.new(
-            self.signer, self.send_nonce, "validator", "validator"
-        )
-        packet = None
-        packet_type = ""
-
+    ) -> ProtocolData | None:
         if isinstance(data, StoreUpdate):
-            packet_type = "store_update"
-            packet = PacketData(
-                packet_id="store_update",
-                data=data.model_dump_json(),
-                validator=verifier.model_dump_json(),
-            )
+            packet_type = PACKET_STORE_UPDATE
         elif isinstance(data, Heartbeat):
-            packet_type = "heartbeat"
-            packet = PacketData(
-                packet_id="heartbeat",
-                data=data.model_dump_json(),
-                validator=verifier.model_dump_json(),
-            )
+            packet_type = PACKET_HEARTBEAT
         elif isinstance(data, HeartbeatResponse):
-            packet_type = "heartbeat_response"
-            packet = PacketData(
-                packet_id="heartbeat_response",
-                data=data.model_dump_json(),
-                validator=verifier.model_dump_json(),
-            )
+            packet_type = PACKET_HEARTBEAT_RESPONSE
+        else:
+            return None
+
+        # Each packet needs a fresh signature: receivers reject any validator
+        # not dated after the last one they accepted
+        verifier = SignedBlockData.new(
+            self.signer, self._send_nonce_data, "validator", "validator"
+        )
+        # Fill the oneof in place so the stream can yield it without re-wrapping
+        packet = ProtocolData()
+        packet_data = packet.packet_data
+        packet_data.packet_id = packet_type
+        packet_data.data = data.to_json()
+        packet_data.validator = verifier.model_dump_json()
 
         # Record metrics for sent packet
-        size_bytes = len(packet.data.encode("utf-8"))
+        size_bytes = len(packet_data.data)
         record_packet_sent(
             network_id=self.send_nonce.network_id,
             dest_node_id=self.verifier.node_id,
@@ -150,11 +160,29 @@ class PulseWaveProtocol(ProtocolHandler):
 
         return packet
 
+    def _handle_store_update(self, data: bytes, conn: RawConnection) -> None:
+        # Peers resend the full store on reconnect and periodic resyncs;
+        # merging an identical payload again cannot change anything. Only
+        # payloads that were actually merged count, so a resend after an
+        # unbound store or a failed merge is still applied.
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest == self._last_update_digest:
+            return
+        if self.handler.handle_incoming_update(StoreUpdate.from_json(data)):
+            self._last_update_digest = digest
+
+    def _handle_heartbeat(self, data: bytes, conn: RawConnection) -> None:
+        heartbeat = Heartbeat.from_json(data)
+        conn.send_response(HeartbeatResponse(node_time=heartbeat.node_time))
+
+    def _handle_heartbeat_response(self, data: bytes, conn: RawConnection) -> None:
+        heartbeat_ack = HeartbeatResponse.from_json(data)
+        self.handler.handle_heartbeat(heartbeat_ack, self.verifier.node_id)
+
     def handle_packet(self, request: PacketData, conn: "RawConnection") -> None:
-        start_time = time.time()
+        start_time = time.monotonic()
 
         sbd = SignedBlockData.model_validate_json(request.validator)
-        validator = Validator.model_validate(sbd.data)
         if sbd.date <= self.mr_sbd.date:
             self.logger.warning(
                 "Received out-of-date packet_data, ignoring",
@@ -162,14 +190,15 @@ class PulseWaveProtocol(ProtocolHandler):
             )
             return
 
-        if validator != self.recv_nonce:
+        # Compare the signed payload as-is; no need to build a Validator
+        if sbd.data != self._recv_nonce_data:
             self.logger.warning(
                 "Received packet_data with invalid nonce, ignoring",
                 node_id=self.verifier.node_id,
             )
             return
 
-        if not sbd.verify(self.verifier, "validator", "validator"):
+        if not sbd.verify(self.verifier, "validator", "validator", cache=False):
             self.logger.warning(
                 "Received packet_data with invalid validator signature, ignoring",
                 node_id=self.verifier.node_id,
@@ -178,7 +207,7 @@ class PulseWaveProtocol(ProtocolHandler):
         self.mr_sbd = sbd  # Update most recent signed block data
 
         # Record metrics for received packet
-        size_bytes = len(request.data.encode("utf-8"))
+        size_bytes = len(request.data)
         record_packet_received(
             network_id=self.recv_nonce.network_id,
             source_node_id=self.verifier.node_id,
@@ -186,29 +215,23 @@ class PulseWaveProtocol(ProtocolHandler):
             size_bytes=size_bytes,
         )
 
-        # Process the packet based on type
-        if request.packet_id == "store_update":
-            try:
-                store_data = StoreUpdate.model_validate_json(request.data)
-                self.handler.handle_incoming_update(store_data)
-            except Exception as e:
-                self.logger.error("Failed to handle StoreUpdate", error=e)
-        elif request.packet_id == "heartbeat":
-            try:
-                heartbeat = Heartbeat.model_validate_json(request.data)
-                response = HeartbeatResponse(node_time=heartbeat.node_time)
-                conn.send_response(response)
-            except Exception as e:
-                self.logger.error("Failed to handle Heartbeat", error=e)
-        elif request.packet_id == "heartbeat_response":
+        handler = self._dispatch.get(request.packet_id)
+        if handler is None:
+            self.logger.warning(
+                "Received unknown packet type, ignoring",
+                packet_type=request.packet_id,
+                node_id=self.verifier.node_id,
+            )
+        else:
             try:
-                heartbeat_ack = HeartbeatResponse.model_validate_json(request.data)
-                self.handler.handle_heartbeat(heartbeat_ack, self.verifier.node_id)
+                handler(request.data, conn)
             except Exception as e:
-                self.logger.error("Failed to handle HeartbeatResponse", error=e)
+                self.logger.error(
+                    "Failed to handle packet", packet_type=request.packet_id, error=e
+                )
 
         # Record packet processing duration
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         record_packet_processing_duration(
             network_id=self.recv_nonce.network_id,
             packet_type=request.packet_id,
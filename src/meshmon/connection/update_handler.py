@@ -1,4 +1,5 @@
 import datetime
+import threading
 import time
 
 import structlog
@@ -8,29 +9,19 @@ from meshmon.prom_export import record_heartbeat_latency
 from meshmon.pulsewave.update.events import ExactPathMatcher
 
 from ..dstypes import DSObjectStatus, DSPingData
-from ..pulsewave.crypto import KeyMapping
+from ..pulsewave.config import PulseWaveConfig
 from ..pulsewave.data import StoreData
 from ..pulsewave.store import SharedStore
 from ..pulsewave.update.update import UpdateHandler, UpdateManager
+from ..pulsewave.views import MutableStoreCtxView
 from .connection import ConnectionManager
 from .grpc_types import HeartbeatResponse, StoreUpdate
 
+# Peers get a full store dump at least this often, even when in sync, so any
+# update they rejected or missed is eventually repaired
+FULL_SYNC_INTERVAL = 60.0
 
-class IncrementalUpdater:
-    def __init__(self):
-        self.end_data = StoreData()
-
-    def diff(self, other: StoreData, exclude_node_id: str) -> StoreData:
-        diff = self.end_data.diff(other)
-        if exclude_node_id in diff.nodes:
-            del diff.nodes[exclude_node_id]
-        return diff
-
-    def update(self, other: StoreData, key_mapping: KeyMapping):
-        self.end_data.update(other, key_mapping)
-
-    def clear(self):
-        self.end_data = StoreData()
+_UTC = datetime.timezone.utc
 
 
 class GrpcUpdateHandler(UpdateHandler):
@@ -50,30 +41,112 @@ class GrpcUpdateHandler(UpdateHandler):
         self._matcher = ExactPathMatcher("instant_update")
         self.network_id = network_id
         self.connection_manager = connection_manager
+        # Set by bind(); updates can arrive before the store exists
+        self.store: SharedStore | None = None
+        self.update_manager: UpdateManager | None = None
+        # Both rate limited handlers call handle_update, so guard sync state
+        self._sync_lock = threading.Lock()
+        # Store as of the last broadcast; deltas are computed against it
+        self._last_sent: StoreData | None = None
+        self._last_full: StoreUpdate | None = None
+        self._last_version = -1
+        # node_id -> Connection.generation that last received a full dump
+        self._synced: dict[str, int] = {}
+        self._next_full_sync = 0.0
+        self._peers: tuple[str, ...] = ()
+        # The local ping context only moves when the store or config changes
+        self._ping_ctx: MutableStoreCtxView[DSPingData] | None = None
 
     def bind(self, store: "SharedStore", update_manager: "UpdateManager") -> None:
+        # Each store wraps this handler twice (update and instant update)
+        if store is not self.store:
+            # A stale store's watcher would otherwise keep overwriting the peers
+            if self.store is not None:
+                self.store.config_watcher.unsubscribe(self._reload_store_config)
+            store.config_watcher.subscribe(self._reload_store_config)
+            self._reload_store_config(store.config)
+            with self._sync_lock:
+                self._last_sent = None
+                self._last_full = None
+                self._synced.clear()
         self.store = store
         self.update_manager = update_manager
 
+    def _reload_store_config(self, config: PulseWaveConfig) -> None:
+        self._ping_ctx = None
+        # Resolve the peer list once per config rather than on every broadcast
+        signer_id = config.current_node.node_id
+        self._peers = tuple(
+            node_id for node_id in config.key_mapping.verifiers if node_id != signer_id
+        )
+
     def handle_update(self) -> None:
-        """Process an incoming update request."""
-        msg = self.store.dump()
-        for node in self.store.nodes:
-            if node == self.store.config.key_mapping.signer.node_id:
-                continue
-            conn = self.connection_manager.get_connection(node, self.network_id)
-            if conn:
-                conn.send_response(StoreUpdate(data=msg))
-
-    def handle_incoming_update(self, update: StoreUpdate) -> None:
-        """Handle an incoming StoreUpdate message."""
-        if not hasattr(self, "store"):
-            self.logger.info("Store not bound, cannot handle incoming update")
+        """Broadcast store changes to connected peers.
+
+        Peers that already hold the previous broadcast only get the delta
+        since then; new or reconnected peers get the full store.
+        """
+        store = self.store
+        if store is None:
             return
-        self.store.update_from_dump(update.data)
+        with self._sync_lock:
+            # Read before dumping so a write racing the dump bumps it again
+            version = store.update_manager.version
+            has_baseline = self._last_sent is not None
+            delta_update: StoreUpdate | None = None
+            if self._last_full is not None and version == self._last_version:
+                full_update = self._last_full
+            else:
+                msg = store.dump()
+                current = StoreData.model_validate_json(msg)
+                # send_response serializes synchronously, so one message per
+                # payload can be shared by every peer
+                full_update = StoreUpdate(data=msg)
+                if self._last_sent is not None:
+                    diff = current.diff(self._last_sent)
+                    if diff.nodes:
+                        delta_update = StoreUpdate(data=diff.model_dump_json())
+                self._last_sent = current
+                self._last_full = full_update
+                self._last_version = version
+            now = time.monotonic()
+            if now >= self._next_full_sync:
+                self._next_full_sync = now + FULL_SYNC_INTERVAL
+                self._synced.clear()
+
+            get_connection = self.connection_manager.get_connection
+            for node in self._peers:
+                conn = get_connection(node, self.network_id)
+                if not conn:
+                    self._synced.pop(node, None)
+                    continue
+                generation = conn.generation
+                if has_baseline and self._synced.get(node) == generation:
+                    if delta_update is not None and not conn.send_response(
+                        delta_update
+                    ):
+                        self._synced.pop(node, None)
+                    continue
+                if conn.send_response(full_update):
+                    self._synced[node] = generation
+                else:
+                    self._synced.pop(node, None)
+
+    def handle_incoming_update(self, update: StoreUpdate) -> bool:
+        """Handle an incoming StoreUpdate message, returning True once merged."""
+        store = self.store
+        if store is None:
+            self.logger.info("Store not bound, cannot handle incoming update")
+            return False
+        store.update_from_dump(update.data)
+        return True
 
     def handle_heartbeat(self, heartbeat_ack: HeartbeatResponse, node_id: str) -> None:
-        node_ctx = self.store.get_context("ping_data", DSPingData)
+        if self.store is None:
+            return
+        node_ctx = self._ping_ctx
+        if node_ctx is None:
+            node_ctx = self._ping_ctx = self.store.get_context("ping_data", DSPingData)
 
         current_status = node_ctx.get(node_id)
         if current_status and current_status.status == DSObjectStatus.OFFLINE:
@@ -83,14 +156,15 @@ class GrpcUpdateHandler(UpdateHandler):
             )
 
         # Calculate RTT
-        rtt_seconds = (time.time_ns() - (heartbeat_ack.node_time)) / 1_000_000_000
+        now_ns = time.time_ns()
+        rtt_seconds = (now_ns - heartbeat_ack.node_time) / 1_000_000_000
 
         node_ctx.set(
             node_id,
             DSPingData(
                 status=DSObjectStatus.ONLINE,
                 req_time_rtt=rtt_seconds,
-                date=datetime.datetime.now(tz=datetime.timezone.utc),
+                date=datetime.datetime.fromtimestamp(now_ns / 1_000_000_000, _UTC),
             ),
         )
 
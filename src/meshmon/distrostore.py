@@ -82,6 +82,8 @@ class StoreManager:
         self.config_watcher = watcher
         self.config_watcher.subscribe(self.load_config)
         self.config_bus = config_bus
+        # Replaced rather than mutated so readers iterating it on other
+        # threads never see it change size underneath them
         self.stores: dict[str, SharedStore] = {}
         self.logger = structlog.stdlib.get_logger().bind(
             module="meshmon.distrostore", component="StoreManager"
@@ -119,7 +121,7 @@ class StoreManager:
         new_store.add_handler(MonitorStatusTableHandler(self.event_log))
         new_store.add_handler(NodeStatusTableHandler(self.event_log))
 
-        self.stores[network_id] = new_store
+        self.stores = {**self.stores, network_id: new_store}
 
         self.logger.debug("Loaded store", network_id=network_id)
 
@@ -179,7 +181,9 @@ class StoreManager:
             )
 
             store.stop()
-            del self.stores[network_id]
+            self.stores = {
+                nid: s for nid, s in self.stores.items() if nid != network_id
+            }
 
             self.event_log.clear_event(
                 mid="node_offline",
@@ -1,5 +1,6 @@
 import datetime
 import enum
+import threading
 
 import pydantic
 import structlog
@@ -34,9 +35,15 @@ class Event(pydantic.BaseModel):
     date: datetime.datetime
 
 
+_INDEXED_FIELDS = ("mid", "src", "network_id", "uid")
+
+
 class EventLog:
     def __init__(self):
         self.events: dict[EventID, Event] = {}
+        # (field, value) -> ids with that value, so clear_event skips a full scan
+        self._index: dict[tuple[str, str | None], set[EventID]] = {}
+        self._lock = threading.Lock()
         self.logger = structlog.stdlib.get_logger().bind(
             module="meshmon.event_log", component="EventLog"
         )
@@ -48,7 +55,12 @@ class EventLog:
             title=title,
             date=datetime.datetime.now(tz=datetime.timezone.utc),
         )
-        self.events[mid] = event
+        with self._lock:
+            if mid not in self.events:
+                for field in _INDEXED_FIELDS:
+                    key = (field, getattr(mid, field))
+                    self._index.setdefault(key, set()).add(mid)
+            self.events[mid] = event
         self.logger.log(
             LEVEL_MAP.get(event_type, 20),
             "Logged event",
@@ -66,22 +78,32 @@ class EventLog:
         uid: str | None = None,
     ):
         if mid is None and src is None and network_id is None and uid is None:
-            self.events.clear()
+            with self._lock:
+                self.events.clear()
+                self._index.clear()
             self.logger.info("Cleared all events")
             return
-        to_delete: list[EventID] = []
-        for eid in self.events.keys():
-            if mid is not None and eid.mid != mid:
-                continue
-            if src is not None and eid.src != src:
-                continue
-            if network_id is not None and eid.network_id != network_id:
-                continue
-            if uid is not None and eid.uid != uid:
-                continue
-            to_delete.append(eid)
+        filters = (("mid", mid), ("src", src), ("network_id", network_id), ("uid", uid))
+        with self._lock:
+            # Start from the smallest candidate set and narrow it down
+            candidates = sorted(
+                (
+                    self._index.get((field, value), set())
+                    for field, value in filters
+                    if value is not None
+                ),
+                key=len,
+            )
+            to_delete = set(candidates[0]).intersection(*candidates[1:])
+            for eid in to_delete:
+                del self.events[eid]
+                for field in _INDEXED_FIELDS:
+                    key = (field, getattr(eid, field))
+                    ids = self._index[key]
+                    ids.discard(eid)
+                    if not ids:
+                        del self._index[key]
         for eid in to_delete:
-            del self.events[eid]
             data = {
                 "mid": eid.mid,
                 "src": eid.src,
@@ -40,6 +40,8 @@ class Repo:
         self.repo_path = Path(repo_path).resolve()
         self.remote = remote
         self.branch = branch
+        self._git_dirs: tuple[Path, Path] | None = None
+        self._head_cache: tuple[tuple[int, ...], str] | None = None
 
         if self.repo_path.exists() and not self._is_git_repo():
             raise GitError(f"Path {self.repo_path} is not a git repository")
@@ -77,19 +79,69 @@ class Repo:
         except Exception:
             return False
 
+    def _get_git_dirs(self) -> tuple[Path, Path]:
+        """Resolve the git dir and the common dir (they differ in worktrees)."""
+        if self._git_dirs is None:
+            result = self._run_git_command(
+                ["rev-parse", "--git-dir", "--git-common-dir"]
+            )
+            git_dir, common_dir = result.stdout.splitlines()
+            self._git_dirs = (self.repo_path / git_dir, self.repo_path / common_dir)
+        return self._git_dirs
+
+    def _head_stamp(self) -> tuple[int, ...] | None:
+        """
+        Stat every file HEAD resolves through.
+
+        git rewrites refs by renaming a lock file over them, so the inode and
+        mtime of HEAD, the branch ref and packed-refs change whenever the
+        checked out commit can have moved. Returns None if HEAD can't be read.
+        """
+        try:
+            git_dir, common_dir = self._get_git_dirs()
+            head = git_dir / "HEAD"
+            paths = [head]
+            ref = head.read_text().strip()
+            if ref.startswith("ref: "):
+                paths += [common_dir / ref[5:], common_dir / "packed-refs"]
+            stamp: list[int] = []
+            for path in paths:
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    # Loose ref or packed-refs may legitimately be absent
+                    stamp += (0, 0)
+                    continue
+                stamp += (st.st_ino, st.st_mtime_ns)
+            return tuple(stamp)
+        except (OSError, GitError, ValueError):
+            return None
+
     def _get_current_commit_hash(self) -> str:
         """Get the current commit hash."""
+        stamp = self._head_stamp()
+        if (
+            stamp is not None
+            and self._head_cache is not None
+            and self._head_cache[0] == stamp
+        ):
+            return self._head_cache[1]
         result = self._run_git_command(["rev-parse", "HEAD"])
-        return result.stdout.strip()
+        commit_hash = result.stdout.strip()
+        self._head_cache = (stamp, commit_hash) if stamp is not None else None
+        return commit_hash
 
     def _get_remote_commit_hash(self) -> str:
         """Get the remote commit hash for the tracking branch."""
-        # Fetch to get latest remote info
-        self._run_git_command(["fetch", self.remote])
-
-        # Get remote commit hash
-        result = self._run_git_command(["rev-parse", f"{self.remote}/{self.branch}"])
-        return result.stdout.strip()
+        # ls-remote only asks for the ref, so polling never downloads objects;
+        # pull() does the actual fetch once an update is known to exist
+        result = self._run_git_command(
+            ["ls-remote", self.remote, f"refs/heads/{self.branch}"]
+        )
+        remote_hash = result.stdout.split(maxsplit=1)
+        if not remote_hash:
+            raise GitError(f"Branch {self.branch} not found on remote {self.remote}")
+        return remote_hash[0]
 
     def needs_update(self) -> bool:
         """
@@ -115,6 +167,7 @@ class Repo:
         logger.warning(
             "Resetting all local changes - this will discard uncommitted work"
         )
+        self._head_cache = None
 
         # Reset to HEAD (discard staged and working directory changes)
         self._run_git_command(["reset", "--hard", "HEAD"])
@@ -127,10 +180,12 @@ class Repo:
     def pull(self, reset_local: bool = True):
         try:
             self.reset_local_changes()
-            self._run_git_command(["fetch", self.remote])
+            # pull fetches on its own, a separate fetch just repeated the round trip
             self._run_git_command(["pull", self.remote, self.branch])
         except Exception as e:
             raise GitError(f"Failed to pull repository: {e}") from e
+        finally:
+            self._head_cache = None
 
     def clone_or_update(self):
         if not self.repo_path.exists():
@@ -1,12 +1,17 @@
 import datetime
+import heapq
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from threading import Event, Thread
+from threading import Event, Lock, Thread
 
 from structlog.stdlib import get_logger
 
 from meshmon.config.config import Config, LoadedNetworkMonitor, LoadedNetworkNodeInfo
 from meshmon.config.structure.network import MonitorTypes
 from meshmon.pulsewave.store import SharedStore
+from meshmon.pulsewave.views import MutableStoreCtxView
 
 from ..config.bus import ConfigBus, ConfigPreprocessor
 from ..distrostore import (
@@ -22,6 +27,96 @@ from .monitors import (
     RebroadcastMonitor,
 )
 
+# Upper bound on concurrently running checks; below it the pool gets one
+# worker per monitor, so a slow check never holds up another monitor
+MAX_MONITOR_WORKERS = 64
+# How far past its due time a check may start before the pool is reported
+# as saturated
+LATE_START_WARNING = 1.0
+
+
+class MonitorScheduler:
+    """Runs every monitor from one timer thread and a shared worker pool."""
+
+    def __init__(self):
+        self.logger = get_logger().bind(
+            module="meshmon.monitor", component="MonitorScheduler"
+        )
+        # Min-heap of (next_due, seq, monitor); seq keeps monitors uncompared
+        self._due: list[tuple[float, int, "Monitor"]] = []
+        self._seq = itertools.count()
+        self._due_lock = Lock()
+        # Set when the heap head may have moved earlier, to cut the sleep short
+        self._wakeup = Event()
+        self.stop_event = Event()
+        # Swapped on resize; submissions hold the lock so none hit a dead pool
+        self._pool_lock = Lock()
+        self._workers = 1
+        self.pool = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="monitor-worker"
+        )
+        self.thread = Thread(target=self.scheduler_loop, name="monitor-scheduler")
+
+    def schedule(self, monitor: "Monitor", delay: float = 0.0) -> None:
+        with self._due_lock:
+            heapq.heappush(
+                self._due, (time.monotonic() + delay, next(self._seq), monitor)
+            )
+        self._wakeup.set()
+
+    def _pop_due(self, now: float) -> list[tuple[float, "Monitor"]]:
+        due = []
+        with self._due_lock:
+            while self._due and self._due[0][0] <= now:
+                due_at, _, monitor = heapq.heappop(self._due)
+                due.append((due_at, monitor))
+        return due
+
+    def resize(self, monitor_count: int) -> None:
+        """Size the worker pool to the monitor set, up to MAX_MONITOR_WORKERS."""
+        workers = max(1, min(MAX_MONITOR_WORKERS, monitor_count))
+        with self._pool_lock:
+            if workers == self._workers or self.stop_event.is_set():
+                return
+            old_pool = self.pool
+            self.pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="monitor-worker"
+            )
+            self._workers = workers
+        # Checks already running on the old pool finish and reschedule normally
+        old_pool.shutdown(wait=False)
+        self.logger.debug("Resized monitor worker pool", workers=workers)
+
+    def _next_wakeup(self, now: float) -> float | None:
+        with self._due_lock:
+            if not self._due:
+                return None
+            return max(0.0, self._due[0][0] - now)
+
+    def scheduler_loop(self) -> None:
+        while True:
+            for due_at, monitor in self._pop_due(time.monotonic()):
+                if monitor.claim_run():
+                    with self._pool_lock:
+                        self.pool.submit(monitor.run_once, due_at)
+            self._wakeup.wait(self._next_wakeup(time.monotonic()))
+            self._wakeup.clear()
+            if self.stop_event.is_set():
+                break
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self._wakeup.set()
+        if self.thread.is_alive():
+            self.thread.join()
+        with self._pool_lock:
+            pool = self.pool
+        pool.shutdown(wait=True)
+        self.logger.debug("Monitor scheduler stopped")
+
 
 class Monitor:
     def __init__(
@@ -30,16 +125,21 @@ class Monitor:
         monitor_name: str,
         network_id: str,
         store_manager: StoreManager,
+        scheduler: MonitorScheduler,
     ):
         self.name = monitor_name
         self.store = store_manager
         self.network_id = network_id
         self.monitor = monitor
-        self.thread = Thread(
-            target=self.monitor_thread,
-            name=f"{self.name}-thread",
-        )
+        # uid hashes the name and group, which are fixed for a monitor's life
+        self.uid = monitor.uid
+        self.scheduler = scheduler
         self.stop_flag = Event()
+        self._stopped = Event()
+        # Guards the hand-off between the scheduler, the worker and stop()
+        self._state_lock = Lock()
+        self._running = False
+        self._initialised = False
         self.logger = get_logger().bind(
             module="meshmon.monitor", component="Monitor", name=self.name
         )
@@ -47,18 +147,15 @@ class Monitor:
     def setup(self):
         store = self.store.get_store(self.network_id)
         ctx = store.get_context("monitor_data", DSMonitorData)
-        data = self.monitor.get_initial()
-        ctx.set(data.get_uid(), data)
+        ctx.set(self.uid, self.monitor.get_initial())
 
     def shutdown(self) -> None:
         store = self.store.get_store(self.network_id)
         ctx = store.get_context("monitor_data", DSMonitorData)
-        ctx.delete(self.monitor.uid)
+        ctx.delete(self.uid)
 
-    def invalidate_old_ping(self):
-        store = self.store.get_store(self.network_id)
-        ctx = store.get_context("monitor_data", DSMonitorData)
-        ping_data = ctx.get(self.monitor.uid)
+    def invalidate_old_ping(self, ctx: MutableStoreCtxView[DSMonitorData]):
+        ping_data = ctx.get(self.uid)
         if ping_data is None:
             return
         now = datetime.datetime.now(datetime.timezone.utc)
@@ -68,7 +165,7 @@ class Monitor:
             and ping_data.status != DSObjectStatus.OFFLINE
         ):
             ctx.set(
-                self.monitor.uid,
+                self.uid,
                 DSMonitorData(
                     status=DSObjectStatus.OFFLINE,
                     req_time_rtt=-1,
@@ -80,37 +177,67 @@ class Monitor:
                 ),
             )
 
-    def monitor_thread(self):
-        self.logger.debug("Starting monitor thread")
-        self.setup()
-        store = self.store.get_store(self.network_id)
-        ctx = store.get_context("monitor_data", DSMonitorData)
-        while True:
-            try:
-                self.invalidate_old_ping()
-                if ping_data := self.monitor.run():
-                    ctx.set(ping_data.get_uid(), ping_data)
-            except Exception as exc:
-                self.logger.error("Error in monitor loop", error=exc)
-            val = self.stop_flag.wait(self.monitor.interval)
-            if val:
-                break
-        self.shutdown()
-        self.logger.debug("Monitor thread stopped")
+    def claim_run(self) -> bool:
+        """Mark the monitor as running unless it has been stopped."""
+        with self._state_lock:
+            if self.stop_flag.is_set():
+                return False
+            self._running = True
+            return True
+
+    def run_once(self, due_at: float) -> None:
+        late = time.monotonic() - due_at
+        if late > LATE_START_WARNING:
+            self.logger.warning(
+                "Monitor check started late; worker pool is saturated",
+                late_s=round(late, 2),
+            )
+        try:
+            if not self._initialised:
+                self.logger.debug("Setting up monitor")
+                self.setup()
+                self._initialised = True
+            store = self.store.get_store(self.network_id)
+            ctx = store.get_context("monitor_data", DSMonitorData)
+            self.invalidate_old_ping(ctx)
+            if ping_data := self.monitor.run():
+                ctx.set(self.uid, ping_data)
+        except Exception as exc:
+            self.logger.error("Error in monitor loop", error=exc)
+        with self._state_lock:
+            self._running = False
+            stopped = self.stop_flag.is_set()
+        if stopped:
+            self._finish()
+        else:
+            self.scheduler.schedule(self, self.monitor.interval)
+
+    def _finish(self) -> None:
+        try:
+            self.shutdown()
+        except Exception as exc:
+            self.logger.error("Error shutting down monitor", error=exc)
+        self._stopped.set()
+        self.logger.debug("Monitor stopped")
 
     def start(self) -> None:
         self.logger.info(
-            "Starting monitor thread at interval", interval_s=self.monitor.interval
+            "Starting monitor at interval", interval_s=self.monitor.interval
         )
-        self.thread.start()
+        self.scheduler.schedule(self)
 
     def stop(self):
         self.logger.info("Stopping monitor")
-        self.stop_flag.set()
+        with self._state_lock:
+            self.stop_flag.set()
+            idle = not self._running
+        # A running check finishes the shutdown itself; an idle one only has a
+        # stale heap entry left, which the scheduler drops
+        if idle:
+            self._finish()
 
     def join(self):
-        self.thread.join()
-        self.logger.debug("Monitor thread stopped")
+        self._stopped.wait()
 
 
 @dataclass(frozen=True)
@@ -227,11 +354,12 @@ class MonitorConfigPreprocessor(ConfigPreprocessor[MonitorConfig]):
                     not monitor.allow or node_id in monitor.allow
                 ):
                     monitors[(net_id, monitor.get_uid())] = monitor
-            for node_config in network.node_config:
-                if node_config.node_id == network.node_id:
-                    rebroadcast.update(
-                        self.get_rebroadcasts(config, node_config, net_id)
-                    )
+            local_node = next(
+                (n for n in network.node_config if n.node_id == network.node_id),
+                None,
+            )
+            if local_node is not None:
+                rebroadcast.update(self.get_rebroadcasts(config, local_node, net_id))
         return MonitorConfig(monitors=monitors, rebroadcast=rebroadcast)
 
 
@@ -256,10 +384,12 @@ class MonitorManager:
         self.rebroadcast: dict[RebroadcastKey, Monitor] = {}
         self.stop_flag = Event()
         self.thread = Thread(target=self.manager, name="monitor-manager")
+        self.scheduler = MonitorScheduler()
         self.logger.debug("MonitorManager initialized")
         # Initialize monitors from current config
         self._create_monitors(self.config.monitors)
         self._create_rebroadcasts(self.config.rebroadcast)
+        self.scheduler.resize(len(self.monitors) + len(self.rebroadcast))
 
     def manager(self):
         while True:
@@ -295,7 +425,11 @@ class MonitorManager:
                     self.logger.debug("Creating HTTP monitor", key=key)
                     monitor = HTTPMonitor(net_id, full_monitor_name, monitor_watcher)
                     monitor_wrapper = Monitor(
-                        monitor, full_monitor_name, net_id, self.store_manager
+                        monitor,
+                        full_monitor_name,
+                        net_id,
+                        self.store_manager,
+                        self.scheduler,
                     )
                     self.monitors[key] = monitor_wrapper
                     monitor_wrapper.start()
@@ -304,7 +438,11 @@ class MonitorManager:
                     self.logger.debug("Creating PING monitor", key=key)
                     monitor = PingMonitor(net_id, full_monitor_name, monitor_watcher)
                     monitor_wrapper = Monitor(
-                        monitor, full_monitor_name, net_id, self.store_manager
+                        monitor,
+                        full_monitor_name,
+                        net_id,
+                        self.store_manager,
+                        self.scheduler,
                     )
                     self.monitors[key] = monitor_wrapper
                     monitor_wrapper.start()
@@ -342,7 +480,11 @@ class MonitorManager:
                     dest_name, key.dest_group, remote_store, monitor_watcher
                 )
                 monitor_wrapper = Monitor(
-                    monitor, full_monitor_name, net_id, self.store_manager
+                    monitor,
+                    full_monitor_name,
+                    net_id,
+                    self.store_manager,
+                    self.scheduler,
                 )
                 self.rebroadcast[key] = monitor_wrapper
                 monitor_wrapper.start()
@@ -412,6 +554,7 @@ class MonitorManager:
             self.rebroadcast.pop(key, None)
 
         self._create_rebroadcasts(desired_rebroadcasts_keys)
+        self.scheduler.resize(len(self.monitors) + len(self.rebroadcast))
 
         self.logger.info(
             "MonitorManager reload complete",
@@ -420,6 +563,7 @@ class MonitorManager:
 
     def start(self):
         self.logger.info("Starting MonitorManager thread")
+        self.scheduler.start()
         self.thread.start()
 
     def stop(self):
@@ -436,6 +580,7 @@ class MonitorManager:
             monitor.join()
         self.rebroadcast.clear()
         self.monitors.clear()
+        self.scheduler.stop()
         self.logger.info("All monitors stopped")
 
     def stop_manager(self):
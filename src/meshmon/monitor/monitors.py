@@ -97,9 +97,10 @@ class HTTPMonitor(MonitorProto):
 
     def run(self):
         try:
-            st = time.time()
-            response = requests.get(f"{self.config.host}", timeout=self.config.interval)
-            rtt = time.time() - st
+            st = time.monotonic()
+            # A monitor never has two checks in flight, so the session is not shared
+            response = self.session.get(self.config.host, timeout=self.config.interval)
+            rtt = time.monotonic() - st
         except requests.RequestException as exc:
             self.logger.debug("Request timed out", exc=exc)
             return
@@ -8,11 +8,15 @@ This module provides comprehensive Prometheus metrics for monitoring:
 - Connection health and link utilization
 """
 
+import threading
 from typing import TYPE_CHECKING
 
 import structlog
 from prometheus_client import Counter, Gauge, Histogram, Info
 
+from meshmon.dstypes import DSMonitorData, DSObjectStatus, DSPingData
+from meshmon.version import VERSION
+
 if TYPE_CHECKING:
     from meshmon.connection.connection import ConnectionManager
     from meshmon.distrostore import StoreManager
@@ -210,6 +214,80 @@ store_update_size_bytes = Histogram(
     buckets=[100, 500, 1000, 5000, 10000, 50000, 100000, 500000, 1000000],
 )
 
+# =============================================================================
+# PACKET METRICS BUFFER
+# =============================================================================
+
+# Pending packet observations that force a flush before the next scrape
+PACKET_METRICS_FLUSH_SIZE = 4096
+
+
+class _PacketMetricsBuffer:
+    """Accumulates per-packet metrics between scrapes.
+
+    Packets are recorded from every stream thread; collapsing them into plain
+    dict updates under one lock is much cheaper than resolving labelled
+    children and taking the prometheus locks for each packet.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # (network_id, node_id, packet_type) -> [packets, bytes]
+        self.received: dict[tuple[str, str, str], list[int]] = {}
+        self.sent: dict[tuple[str, str, str], list[int]] = {}
+        # (network_id, direction, size_bytes)
+        self.store_update_sizes: list[tuple[str, str, int]] = []
+        # (network_id, packet_type, duration_seconds)
+        self.durations: list[tuple[str, str, float]] = []
+        self.pending = 0
+
+    def add_packet(
+        self,
+        totals: str,
+        key: tuple[str, str, str],
+        size_bytes: int,
+        direction: str,
+    ) -> bool:
+        """Buffer one packet; returns True once the buffer should be flushed."""
+        with self._lock:
+            counts = getattr(self, totals)
+            entry = counts.get(key)
+            if entry is None:
+                counts[key] = [1, size_bytes]
+            else:
+                entry[0] += 1
+                entry[1] += size_bytes
+            if key[2] == "store_update":
+                self.store_update_sizes.append((key[0], direction, size_bytes))
+            self.pending += 1
+            return self.pending >= PACKET_METRICS_FLUSH_SIZE
+
+    def add_duration(
+        self, network_id: str, packet_type: str, duration_seconds: float
+    ) -> bool:
+        with self._lock:
+            self.durations.append((network_id, packet_type, duration_seconds))
+            self.pending += 1
+            return self.pending >= PACKET_METRICS_FLUSH_SIZE
+
+    def drain(self):
+        with self._lock:
+            data = (
+                self.received,
+                self.sent,
+                self.store_update_sizes,
+                self.durations,
+            )
+            self._reset()
+        return data
+
+
+_packet_metrics = _PacketMetricsBuffer()
+
+
 # =============================================================================
 # SYSTEM METRICS
 # =============================================================================
@@ -245,8 +323,6 @@ def update_node_metrics(store_manager: "StoreManager") -> None:
     This function reads the current node statuses from all stores and
     updates the corresponding Prometheus metrics.
     """
-    from meshmon.dstypes import DSPingData
-
     try:
         for network_id, store in store_manager.stores.items():
             # Get node status data
@@ -298,8 +374,6 @@ def update_monitor_metrics(store_manager: "StoreManager") -> None:
     This function reads the current monitor statuses from all stores and
     updates the corresponding Prometheus metrics.
     """
-    from meshmon.dstypes import DSMonitorData
-
     try:
         for network_id, store in store_manager.stores.items():
             # Get monitor data
@@ -429,8 +503,6 @@ def update_system_metrics(store_manager: "StoreManager") -> None:
         meshmon_networks_active.set(len(store_manager.stores))
 
         # Set version info
-        from meshmon.version import VERSION
-
         meshmon_info.info(
             {
                 "version": VERSION,
@@ -467,8 +539,6 @@ def _status_to_value(status) -> float:
         0.5 for UNKNOWN
         0.0 for OFFLINE
     """
-    from meshmon.dstypes import DSObjectStatus
-
     if status == DSObjectStatus.ONLINE:
         return 1.0
     elif status == DSObjectStatus.UNKNOWN:
@@ -491,29 +561,18 @@ def record_packet_received(
     """
     Record a received packet.
 
+    The observation is buffered and applied on the next flush_packet_metrics().
+
     Args:
         network_id: Network identifier
         source_node_id: Source node identifier
         packet_type: Type of packet (heartbeat, heartbeat_response, store_update)
         size_bytes: Size of packet payload in bytes
     """
-    grpc_packets_received_total.labels(
-        network_id=network_id,
-        source_node_id=source_node_id,
-        packet_type=packet_type,
-    ).inc()
-
-    grpc_bytes_received_total.labels(
-        network_id=network_id,
-        source_node_id=source_node_id,
-        packet_type=packet_type,
-    ).inc(size_bytes)
-
-    if packet_type == "store_update":
-        store_update_size_bytes.labels(
-            network_id=network_id,
-            direction="inbound",
-        ).observe(size_bytes)
+    if _packet_metrics.add_packet(
+        "received", (network_id, source_node_id, packet_type), size_bytes, "inbound"
+    ):
+        flush_packet_metrics()
 
 
 def record_packet_sent(
@@ -525,29 +584,59 @@ def record_packet_sent(
     """
     Record a sent packet.
 
+    The observation is buffered and applied on the next flush_packet_metrics().
+
     Args:
         network_id: Network identifier
         dest_node_id: Destination node identifier
         packet_type: Type of packet (heartbeat, heartbeat_response, store_update)
         size_bytes: Size of packet payload in bytes
     """
-    grpc_packets_sent_total.labels(
-        network_id=network_id,
-        dest_node_id=dest_node_id,
-        packet_type=packet_type,
-    ).inc()
+    if _packet_metrics.add_packet(
+        "sent", (network_id, dest_node_id, packet_type), size_bytes, "outbound"
+    ):
+        flush_packet_metrics()
 
-    grpc_bytes_sent_total.labels(
-        network_id=network_id,
-        dest_node_id=dest_node_id,
-        packet_type=packet_type,
-    ).inc(size_bytes)
 
-    if packet_type == "store_update":
+def flush_packet_metrics() -> None:
+    """
+    Apply buffered packet observations to the prometheus metrics.
+
+    Called before each scrape so exported values are current.
+    """
+    received, sent, store_update_sizes, durations = _packet_metrics.drain()
+    for (network_id, node_id, packet_type), (packets, size) in received.items():
+        grpc_packets_received_total.labels(
+            network_id=network_id,
+            source_node_id=node_id,
+            packet_type=packet_type,
+        ).inc(packets)
+        grpc_bytes_received_total.labels(
+            network_id=network_id,
+            source_node_id=node_id,
+            packet_type=packet_type,
+        ).inc(size)
+    for (network_id, node_id, packet_type), (packets, size) in sent.items():
+        grpc_packets_sent_total.labels(
+            network_id=network_id,
+            dest_node_id=node_id,
+            packet_type=packet_type,
+        ).inc(packets)
+        grpc_bytes_sent_total.labels(
+            network_id=network_id,
+            dest_node_id=node_id,
+            packet_type=packet_type,
+        ).inc(size)
+    for network_id, direction, size in store_update_sizes:
         store_update_size_bytes.labels(
             network_id=network_id,
-            direction="outbound",
-        ).observe(size_bytes)
+            direction=direction,
+        ).observe(size)
+    for network_id, packet_type, duration_seconds in durations:
+        grpc_packet_processing_duration_seconds.labels(
+            network_id=network_id,
+            packet_type=packet_type,
+        ).observe(duration_seconds)
 
 
 def record_connection_established(
@@ -669,10 +758,8 @@ def record_packet_processing_duration(
         packet_type: Type of packet (heartbeat, heartbeat_response, store_update)
         duration_seconds: Processing duration in seconds
     """
-    grpc_packet_processing_duration_seconds.labels(
-        network_id=network_id,
-        packet_type=packet_type,
-    ).observe(duration_seconds)
+    if _packet_metrics.add_duration(network_id, packet_type, duration_seconds):
+        flush_packet_metrics()
 
 
 def record_heartbeat_latency(
@@ -805,6 +892,9 @@ def cleanup_connection_metrics(network_id: str, node_id: str) -> None:
         network_id: Network identifier
         node_id: Remote node identifier
     """
+    # Apply pending observations first so they cannot recreate removed series
+    flush_packet_metrics()
+
     packet_types = ["heartbeat", "heartbeat_response", "store_update"]
     directions = ["inbound", "outbound"]
     initiators = ["local", "remote"]
@@ -1004,6 +1094,7 @@ def cleanup_network_metrics(
         pass
 
     # Clean up store update size metrics
+    flush_packet_metrics()
     for direction in ["inbound", "outbound"]:
         try:
             store_update_size_bytes.remove(network_id, direction)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 
 from .crypto import KeyMapping, Signer, Verifier
 
@@ -36,7 +37,8 @@ class PulseWaveConfig:
             return self.current_node.verifier
         return None
 
-    @property
+    # Configs are replaced, not mutated, on reload, so build the mapping once
+    @cached_property
     def key_mapping(self) -> KeyMapping:
         verifiers = {cfg.node_id: cfg.verifier for cfg in self.nodes.values()}
         verifiers[self.current_node.node_id] = self.current_node.verifier
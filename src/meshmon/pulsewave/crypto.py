@@ -1,5 +1,8 @@
 import base64
+import hashlib
 import os
+import threading
+from collections import OrderedDict
 
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import serialization
@@ -9,6 +12,9 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import (
 )
 from structlog.stdlib import get_logger
 
+# Signatures each Verifier remembers as valid; merges re-verify the same blocks
+VERIFIED_CACHE_SIZE = 4096
+
 
 class Verifier:
     def __init__(self, peer_id: str, public_key: Ed25519PublicKey):
@@ -17,6 +23,9 @@ class Verifier:
         )
         self.node_id = peer_id
         self.public_key = public_key
+        # LRU of verified signatures, shared by every stream thread for the peer
+        self._verified: OrderedDict[bytes, None] = OrderedDict()
+        self._verified_lock = threading.Lock()
 
     @classmethod
     def by_id(cls, peer_id: str, key_dir):
@@ -44,14 +53,27 @@ class Verifier:
         b64_sig, b64_content = message.split(".")
         content = base64.b64decode(b64_content)
         sig = base64.b64decode(b64_sig)
-        if not self.verify(content, sig, path="decode_message"):
+        if not self.verify(content, sig, path="decode_message", cache=False):
             return None
         return content.decode("utf-8")
 
-    def verify(self, message: bytes, signature: bytes, path: str = "") -> bool:
+    def verify(
+        self, message: bytes, signature: bytes, path: str = "", cache: bool = True
+    ) -> bool:
         """
         Verify the signature of the raw message using the public key.
+
+        Pass cache=False for one-shot signatures (validators, handshakes) so
+        they don't push repeatedly merged store blocks out of the cache.
         """
+        cache_key = None
+        if cache:
+            # Ed25519 signatures are fixed length, so the concatenation is unambiguous
+            cache_key = hashlib.blake2b(signature + message, digest_size=16).digest()
+            with self._verified_lock:
+                if cache_key in self._verified:
+                    self._verified.move_to_end(cache_key)
+                    return True
         try:
             self.public_key.verify(signature, message)
             self.logger.debug(
@@ -59,6 +81,11 @@ class Verifier:
                 node_id=self.node_id,
                 path=path,
             )
+            if cache_key is not None:
+                with self._verified_lock:
+                    self._verified[cache_key] = None
+                    if len(self._verified) > VERIFIED_CACHE_SIZE:
+                        self._verified.popitem(last=False)
             return True
         except InvalidSignature:
             self.logger.warning(
@@ -1,27 +1,46 @@
-import base64
+import binascii
 import datetime
 import json
 from enum import Enum
 
-from pydantic import BaseModel
+import pydantic_core
+from pydantic import BaseModel, PrivateAttr
 from structlog.stdlib import get_logger
 
 from .crypto import KeyMapping, Signer, Verifier
 
 logger = get_logger()
 
+_UTC = datetime.timezone.utc
+
+
+def _utcnow() -> datetime.datetime:
+    return datetime.datetime.now(_UTC)
+
 
 class DateEvalType(Enum):
     OLDER = "OLDER"
     NEWER = "NEWER"
 
 
-class SignedBlockSignature(BaseModel):
-    date: datetime.datetime
-    data: dict
-    block_id: str
-    secret: str | None = None
-    replacement_type: DateEvalType
+def _block_signature_payload(
+    data: dict,
+    date: datetime.datetime,
+    block_id: str,
+    secret: str | None,
+    replacement_type: DateEvalType,
+) -> bytes:
+    # Byte-identical to the model_dump_json() of the SignedBlockSignature model
+    # this replaced; key order and encoding are part of the signature format
+    return pydantic_core.to_json(
+        {
+            "date": date,
+            "data": data,
+            "block_id": block_id,
+            "secret": secret,
+            "replacement_type": replacement_type,
+        }
+    )
 
 
 class SignedBlockData(BaseModel):
@@ -30,31 +49,35 @@ class SignedBlockData(BaseModel):
     block_id: str
     replacement_type: DateEvalType
     signature: str
+    _parsed: BaseModel | None = PrivateAttr(default=None)
+
+    def parse[T: BaseModel](self, model: type[T]) -> T:
+        """Validate data as model, reusing the last result for the same model.
+
+        Blocks are replaced rather than mutated on update, so the cached
+        instance is shared between readers and must be treated as read-only.
+        """
+        parsed = self._parsed
+        if type(parsed) is not model:
+            parsed = self._parsed = model.model_validate(self.data)
+        return parsed  # type: ignore[return-value]
 
     @classmethod
     def new(
         cls,
         signer: Signer,
-        data: BaseModel,
+        data: BaseModel | dict,
         block_id: str,
         path: str = "",
         rep_type: DateEvalType = DateEvalType.NEWER,
         secret: str | None = None,
     ) -> "SignedBlockData":
-        model_data = data.model_dump(mode="json")
-        date = datetime.datetime.now(datetime.timezone.utc)
-        data_sig_str = (
-            SignedBlockSignature(
-                data=model_data,
-                date=date,
-                block_id=block_id,
-                replacement_type=rep_type,
-                secret=secret,
-            )
-            .model_dump_json()
-            .encode()
+        model_data = data if isinstance(data, dict) else data.model_dump(mode="json")
+        date = _utcnow()
+        data_sig_str = _block_signature_payload(
+            model_data, date, block_id, secret, rep_type
         )
-        encoded = base64.b64encode(signer.sign(data_sig_str)).decode()
+        encoded = binascii.b2a_base64(signer.sign(data_sig_str), newline=False).decode()
         logger.debug(
             "Creating new SignedNodeData for signer", node_id=signer.node_id, path=path
         )
@@ -72,17 +95,17 @@ class SignedBlockData(BaseModel):
         block_id: str,
         path: str = "",
         secret: str | None = None,
+        cache: bool = True,
     ) -> bool:
-        data_sig_str = SignedBlockSignature(
-            data=self.data,
-            date=self.date,
-            block_id=self.block_id,
-            secret=secret,
-            replacement_type=self.replacement_type,
-        ).model_dump_json()
+        data_sig_str = _block_signature_payload(
+            self.data, self.date, self.block_id, secret, self.replacement_type
+        )
         verified = (
             verifier.verify(
-                data_sig_str.encode(), base64.b64decode(self.signature), path=path
+                data_sig_str,
+                binascii.a2b_base64(self.signature),
+                path=path,
+                cache=cache,
             )
             and self.block_id == block_id
         )
@@ -97,7 +120,7 @@ class StoreContextData(BaseModel):
     sig: str
 
     def resign(self, signer: Signer, path: str) -> list[str]:
-        date = datetime.datetime.now(datetime.timezone.utc)
+        date = _utcnow()
         sig_str = json.dumps(
             {
                 "context_name": self.context_name,
@@ -105,17 +128,17 @@ class StoreContextData(BaseModel):
                 "allowed_keys": self.allowed_keys,
             }
         ).encode()
-        sig = base64.b64encode(signer.sign(sig_str)).decode()
+        sig = binascii.b2a_base64(signer.sign(sig_str), newline=False).decode()
         self.date = date
         self.sig = sig
         updated_keys = [path]
-        for key in list(self.data.keys()):  # we usually resign when allowed keys change
-            if key not in self.allowed_keys and key in self.data:
-                logger.info(
-                    f"Removing disallowed key {key} from context {self.context_name}"
-                )
-                updated_keys.append(key)
-                del self.data[key]
+        # we usually resign when allowed keys change
+        for key in self.data.keys() - set(self.allowed_keys):
+            logger.info(
+                f"Removing disallowed key {key} from context {self.context_name}"
+            )
+            updated_keys.append(f"{path}.{key}")
+            del self.data[key]
         return updated_keys
 
     @classmethod
@@ -124,7 +147,7 @@ class StoreContextData(BaseModel):
     ) -> "StoreContextData":
         if allowed_keys is None:
             allowed_keys = []
-        date = datetime.datetime.now(datetime.timezone.utc)
+        date = _utcnow()
         sig_str = json.dumps(
             {
                 "context_name": context_name,
@@ -132,7 +155,7 @@ class StoreContextData(BaseModel):
                 "allowed_keys": allowed_keys,
             }
         ).encode()
-        sig = base64.b64encode(signer.sign(sig_str)).decode()
+        sig = binascii.b2a_base64(signer.sign(sig_str), newline=False).decode()
         return cls(
             data={},
             date=date,
@@ -150,7 +173,7 @@ class StoreContextData(BaseModel):
             }
         ).encode()
         verified = (
-            verifier.verify(sig_str, base64.b64decode(self.sig), path=path)
+            verifier.verify(sig_str, binascii.a2b_base64(self.sig), path=path)
             and self.context_name == context_name
         )
         return verified
@@ -183,40 +206,35 @@ class StoreContextData(BaseModel):
                 logger.debug(
                     f"Allowed keys updated for context {self.context_name}: {old_allowed_keys} -> {self.allowed_keys}"
                 )
-                for key in list(self.data.keys()):
-                    if key not in self.allowed_keys:
-                        logger.info(
-                            f"Removing disallowed key {key} from context {self.context_name}"
-                        )
-                        del self.data[key]
+                for key in self.data.keys() - set(self.allowed_keys):
+                    logger.info(
+                        f"Removing disallowed key {key} from context {self.context_name}"
+                    )
+                    del self.data[key]
             updated_paths.append(path)
 
+        # allowed_keys is a list on the wire; test membership against a set
+        allowed = frozenset(self.allowed_keys)
         for key, value in context_data.data.items():
-            if key not in self.allowed_keys:
-                if key in self.data:
+            current = self.data.get(key)
+            if key not in allowed:
+                if current is not None:
                     logger.info(
                         f"Removing deleted key {key} from context {self.context_name}"
                     )
                     del self.data[key]
                 continue
-            if key not in self.data:
-                if value.verify(verifier, key, f"{path}.{key}"):
-                    self.data[key] = value
-                    updated_paths.append(f"{path}.{key}")
-            elif (
-                value.replacement_type == DateEvalType.NEWER
-                and value.date > self.data[key].date
-            ):
-                if value.verify(verifier, key, f"{path}.{key}"):
-                    self.data[key] = value
-                    updated_paths.append(f"{path}.{key}")
-            elif (
-                value.replacement_type == DateEvalType.OLDER
-                and value.date < self.data[key].date
-            ):
-                if value.verify(verifier, key, f"{path}.{key}"):
-                    self.data[key] = value
-                    updated_paths.append(f"{path}.{key}")
+            if current is None:
+                replace = True
+            elif value.replacement_type == DateEvalType.NEWER:
+                replace = value.date > current.date
+            elif value.replacement_type == DateEvalType.OLDER:
+                replace = value.date < current.date
+            else:
+                replace = False
+            if replace and value.verify(verifier, key, f"{path}.{key}"):
+                self.data[key] = value
+                updated_paths.append(f"{path}.{key}")
         return updated_paths
 
     def diff(self, other: "StoreContextData") -> "StoreContextData | None":
@@ -239,23 +257,16 @@ class StoreContextData(BaseModel):
                 allowed_keys=other.allowed_keys,
             )
 
-        combined_keys = set(self.data.keys()).union(set(other.data.keys()))
-        for key in combined_keys:
-            if key in self.data and key not in other.data:
+        for key in self.data.keys() | other.data.keys():
+            ours = self.data.get(key)
+            theirs = other.data.get(key)
+            if theirs is None:
                 diff_data.data[key] = self.data[key]
-            elif key not in self.data and key in other.data:
-                diff_data.data[key] = other.data[key]
-            else:
-                if self.data[key].date > other.data[key].date:
-                    diff_data.data[key] = self.data[key]
-                elif other.data[key].date > self.data[key].date:
-                    diff_data.data[key] = other.data[key]
-        if (
-            not diff_data.data
-            and diff_data.date == self.date
-            and diff_data.sig == self.sig
-            and diff_data.allowed_keys == self.allowed_keys
-        ):
+            elif ours is None or theirs.date > ours.date:
+                diff_data.data[key] = theirs
+            elif ours.date > theirs.date:
+                diff_data.data[key] = ours
+        if not diff_data.data and self.date == other.date and self.sig == other.sig:
             return None
         return diff_data
 
@@ -329,17 +340,17 @@ class StoreConsistentContextData(BaseModel):
             }
         ).encode()
         verified = (
-            verifier.verify(data, base64.b64decode(self.sig), path=path) and verified
+            verifier.verify(data, binascii.a2b_base64(self.sig), path=path) and verified
         )
         return verified
 
     @classmethod
     def new(cls, signer: Signer, ctx_name: str, path: str, secret: str | None = None):
-        date = datetime.datetime.now(datetime.timezone.utc)
+        date = _utcnow()
         data = json.dumps(
             {"ctx_name": ctx_name, "date": date.isoformat(timespec="microseconds")}
         ).encode()
-        sig = base64.b64encode(signer.sign(data)).decode()
+        sig = binascii.b2a_base64(signer.sign(data), newline=False).decode()
         return cls(
             context=StoreContextData.new(signer, "context"),
             leader=SignedBlockData.new(
@@ -429,6 +440,9 @@ class StoreConsistentContextData(BaseModel):
     ) -> "StoreConsistentContextData | None":
         if self.ctx_name != other.ctx_name:
             return None
+        if self.date != other.date:
+            # A newer header replaces context and leader wholesale on update
+            return self if self.date > other.date else other
 
         if self.context and other.context:
             ctx_diff = self.context.diff(other.context)
@@ -455,24 +469,21 @@ class StoreConsistentContextData(BaseModel):
         else:
             leader_diff = self.leader
 
-        if self.date >= other.date:
-            diff_data = StoreConsistentContextData(
-                context=ctx_diff,
-                leader=leader_diff,
-                ctx_name=self.ctx_name,
-                sig=self.sig,
-                date=self.date,
-            )
-        else:
-            diff_data = StoreConsistentContextData(
-                context=ctx_diff,
-                leader=leader_diff,
-                ctx_name=other.ctx_name,
-                sig=other.sig,
-                date=other.date,
-            )
+        if (
+            ctx_diff is None
+            and self.leader is not None
+            and other.leader is not None
+            and self.leader.date == other.leader.date
+        ):
+            return None
 
-        return diff_data
+        return StoreConsistentContextData(
+            context=ctx_diff,
+            leader=leader_diff,
+            ctx_name=self.ctx_name,
+            sig=self.sig,
+            date=self.date,
+        )
 
     def all_paths(self, path: str) -> list[str]:
         paths = []
@@ -494,26 +505,20 @@ class StoreConsistencyData(BaseModel):
     sig: str
 
     def resign(self, signer: Signer, path: str) -> list[str]:
-        date = datetime.datetime.now(datetime.timezone.utc)
+        date = _utcnow()
         sig_data = json.dumps(
             {
                 "date": date.isoformat(timespec="microseconds"),
                 "allowed_contexts": self.allowed_contexts,
             }
         ).encode()
-        self.sig = base64.b64encode(signer.sign(sig_data)).decode()
+        self.sig = binascii.b2a_base64(signer.sign(sig_data), newline=False).decode()
         self.date = date
         updated_keys = [path]
-        for context in list(self.consistent_contexts.values()):
-            if (
-                context not in self.allowed_contexts
-                and context.ctx_name in self.consistent_contexts
-            ):
-                logger.info(
-                    f"Removing disallowed consistent context {context.ctx_name}"
-                )
-                del self.consistent_contexts[context.ctx_name]
-                updated_keys.append(f"{path}.consistent_contexts.{context.ctx_name}")
+        for ctx_name in self.consistent_contexts.keys() - set(self.allowed_contexts):
+            logger.info(f"Removing disallowed consistent context {ctx_name}")
+            del self.consistent_contexts[ctx_name]
+            updated_keys.append(f"{path}.consistent_contexts.{ctx_name}")
         return updated_keys
 
     @classmethod
@@ -521,14 +526,16 @@ class StoreConsistencyData(BaseModel):
         clock_table = StoreContextData.new(signer, "clock_table")
         node_status_table = StoreContextData.new(signer, "node_status_table")
         pulse_table = StoreContextData.new(signer, "pulse_table")
-        date = datetime.datetime.now(datetime.timezone.utc)
+        date = _utcnow()
         sig_data = json.dumps(
             {
                 "date": date.isoformat(timespec="microseconds"),
                 "allowed_contexts": [],
             }
         )
-        sig = base64.b64encode(signer.sign(sig_data.encode())).decode()
+        sig = binascii.b2a_base64(
+            signer.sign(sig_data.encode()), newline=False
+        ).decode()
         return cls(
             clock_table=clock_table,
             node_status_table=node_status_table,
@@ -678,29 +685,28 @@ class StoreConsistencyData(BaseModel):
             diff_data.clock_pulse = self.clock_pulse
         elif not self.clock_pulse and other.clock_pulse:
             diff_data.clock_pulse = other.clock_pulse
-        if (
-            diff_data.clock_table is self.clock_table
-            and diff_data.node_status_table is self.node_status_table
-            and diff_data.clock_pulse is self.clock_pulse
-        ):
-            return None
 
-        combined_keys = set(self.consistent_contexts.keys()).union(
-            set(other.consistent_contexts.keys())
-        )
-        for key in combined_keys:
-            if key in self.consistent_contexts and key not in other.consistent_contexts:
+        for key in self.consistent_contexts.keys() | other.consistent_contexts.keys():
+            ours = self.consistent_contexts.get(key)
+            theirs = other.consistent_contexts.get(key)
+            if theirs is None:
                 diff_data.consistent_contexts[key] = self.consistent_contexts[key]
-            elif (
-                key not in self.consistent_contexts and key in other.consistent_contexts
-            ):
-                diff_data.consistent_contexts[key] = other.consistent_contexts[key]
-            else:
-                if diff := self.consistent_contexts[key].diff(
-                    other.consistent_contexts[key]
-                ):
-                    diff_data.consistent_contexts[key] = diff
+            elif ours is None:
+                diff_data.consistent_contexts[key] = theirs
+            elif diff := ours.diff(theirs):
+                diff_data.consistent_contexts[key] = diff
 
+        self_pulse = self.clock_pulse.date if self.clock_pulse else None
+        other_pulse = other.clock_pulse.date if other.clock_pulse else None
+        if (
+            clock_table_diff is None
+            and node_status_table_diff is None
+            and pulse_table_diff is None
+            and self_pulse == other_pulse
+            and self.date == other.date
+            and not diff_data.consistent_contexts
+        ):
+            return None
         return diff_data
 
     def verify(self, verifier: Verifier, path: str) -> bool:
@@ -832,28 +838,24 @@ class StoreNodeData(BaseModel):
             values={},
             consistency=None,
         )
-        combined_contexts = set(self.contexts.keys()).union(set(other.contexts.keys()))
-        for context_name in combined_contexts:
-            if context_name in self.contexts and context_name not in other.contexts:
+        for context_name in self.contexts.keys() | other.contexts.keys():
+            ours = self.contexts.get(context_name)
+            theirs = other.contexts.get(context_name)
+            if theirs is None:
                 diff_data.contexts[context_name] = self.contexts[context_name]
-            elif context_name not in self.contexts and context_name in other.contexts:
-                diff_data.contexts[context_name] = other.contexts[context_name]
-            else:
-                if diff := self.contexts[context_name].diff(
-                    other.contexts[context_name]
-                ):
-                    diff_data.contexts[context_name] = diff
-        combined_values = set(self.values.keys()).union(set(other.values.keys()))
-        for key in combined_values:
-            if key in self.values and key not in other.values:
+            elif ours is None:
+                diff_data.contexts[context_name] = theirs
+            elif diff := ours.diff(theirs):
+                diff_data.contexts[context_name] = diff
+        for key in self.values.keys() | other.values.keys():
+            ours = self.values.get(key)
+            theirs = other.values.get(key)
+            if theirs is None:
                 diff_data.values[key] = self.values[key]
-            elif key not in self.values and key in other.values:
-                diff_data.values[key] = other.values[key]
-            else:
-                if self.values[key].date > other.values[key].date:
-                    diff_data.values[key] = self.values[key]
-                elif other.values[key].date > self.values[key].date:
-                    diff_data.values[key] = other.values[key]
+            elif ours is None or theirs.date > ours.date:
+                diff_data.values[key] = theirs
+            elif ours.date > theirs.date:
+                diff_data.values[key] = ours
         if self.consistency and other.consistency:
             diff_data.consistency = self.consistency.diff(other.consistency)
         elif self.consistency and not other.consistency:
@@ -930,15 +932,15 @@ class StoreData(BaseModel):
 
     def diff(self, other: "StoreData") -> "StoreData":
         diff_data = StoreData(nodes={})
-        combined_nodes = set(self.nodes.keys()).union(set(other.nodes.keys()))
-        for node_id in combined_nodes:
-            if node_id in self.nodes and node_id not in other.nodes:
+        for node_id in self.nodes.keys() | other.nodes.keys():
+            ours = self.nodes.get(node_id)
+            theirs = other.nodes.get(node_id)
+            if theirs is None:
                 diff_data.nodes[node_id] = self.nodes[node_id]
-            elif node_id not in self.nodes and node_id in other.nodes:
-                diff_data.nodes[node_id] = other.nodes[node_id]
-            else:
-                if diff := self.nodes[node_id].diff(other.nodes[node_id]):
-                    diff_data.nodes[node_id] = diff
+            elif ours is None:
+                diff_data.nodes[node_id] = theirs
+            elif diff := ours.diff(theirs):
+                diff_data.nodes[node_id] = diff
 
         return diff_data
 
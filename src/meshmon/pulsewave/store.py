@@ -1,4 +1,4 @@
-from typing import Iterator, overload
+from typing import Iterator, KeysView, overload
 
 import structlog
 from pydantic import BaseModel
@@ -45,6 +45,8 @@ class SharedStore:
         network_id: str | None = None,
     ):
         self.store: StoreData = StoreData()
+        # (update_manager.version, json) of the last dump
+        self._dump_cache: tuple[int, str] | None = None
         self.config_watcher = config_watcher
         self.config = config_watcher.current_config
         # Store network_id for metric cleanup, fallback to current_node.node_id if not provided
@@ -215,7 +217,7 @@ class SharedStore:
     ) -> T | None:
         if node_data := self._get_node(node_id):
             if value_data := node_data.values.get(value_id):
-                return model.model_validate(value_data.data)
+                return value_data.parse(model)
 
     def set_value(
         self,
@@ -412,8 +414,16 @@ class SharedStore:
                 self.update_manager,
             )
 
-    def dump(self):
-        return self.store.model_dump_json()
+    def dump(self) -> str:
+        # Every write bumps the version after mutating, so reading it first
+        # means a write racing the dump can only invalidate the cache early
+        version = self.update_manager.version
+        cached = self._dump_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        dumped = self.store.model_dump_json()
+        self._dump_cache = (version, dumped)
+        return dumped
 
     def update_from_dump(self, data: str) -> None:
         new_store = StoreData.model_validate_json(data)
@@ -422,8 +432,8 @@ class SharedStore:
             self.update_manager.trigger_update(updated_paths)
 
     @property
-    def nodes(self) -> list[str]:
-        return list(self.config.key_mapping.verifiers.keys())
+    def nodes(self) -> KeysView[str]:
+        return self.config.key_mapping.verifiers.keys()
 
     def stop(self):
         self.update_manager.stop()
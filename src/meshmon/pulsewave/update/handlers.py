@@ -1,5 +1,5 @@
 import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from pydantic import BaseModel
 
@@ -244,7 +244,7 @@ class LeaderElectionHandler(UpdateHandler):
         self.store = store
         self.update_manager = update_manager
 
-    def _get_online_nodes(self, nodes: list[str]) -> list[str]:
+    def _get_online_nodes(self, nodes: Iterable[str]) -> list[str]:
         online_nodes = []
         consistency = self.store.get_consistency()
         node_status_table = consistency.node_status_table
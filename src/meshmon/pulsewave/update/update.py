@@ -123,6 +123,9 @@ class UpdateManager:
 
         self.update_queue = DedupeQueue()
         self.update_controller = UpdateController()
+        # Bumped on every store write so consumers can skip unchanged ticks
+        self.version = 0
+        self._version_lock = Lock()
 
         self.store = store
         self.update_thread: Thread = Thread(
@@ -146,6 +149,8 @@ class UpdateManager:
         self.event_controller.add(handler)
 
     def trigger_update(self, path: list[str]):
+        with self._version_lock:
+            self.version += 1
         self.idle.clear()
         self.update_queue.add(path)
 
@@ -52,10 +52,19 @@ class StoreCtxView[T: BaseModel]:
         return key in self.context_data.data
 
     def get(self, key: str) -> T | None:
-        if key in self.context_data.data:
-            return self.model.model_validate(self.context_data.data[key].data)
+        block = self.context_data.data.get(key)
+        if block is not None:
+            return block.parse(self.model)
         return None
 
+    def snapshot(self) -> tuple[tuple[str, T], ...]:
+        """Parse every entry in one pass over a copy of the context."""
+        model = self.model
+        return tuple(
+            (key, block.parse(model))
+            for key, block in list(self.context_data.data.items())
+        )
+
 
 class MutableStoreCtxView[T: BaseModel](StoreCtxView[T]):
     def __init__(
@@ -42,6 +42,7 @@ from meshmon.event_log import EventLog
 from meshmon.lifecycle import LifecycleManager
 from meshmon.monitor.manager import MonitorManager
 from meshmon.prom_export import (
+    flush_packet_metrics,
     update_connection_metrics,
     update_monitor_metrics,
     update_node_metrics,
@@ -246,6 +247,7 @@ def metrics():
     update_monitor_metrics(store_manager)
     update_connection_metrics(grpc_server.connection_manager)
     update_system_metrics(store_manager)
+    flush_packet_metrics()
 
     # Generate and return Prometheus metrics
     metrics_data = generate_latest()
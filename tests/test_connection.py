@@ -0,0 +1,126 @@
+# pyright: reportArgumentType=false
+# The fakes below only implement what the code under test calls
+import threading
+
+import pytest
+import structlog
+
+import meshmon.distrostore  # noqa: F401  # resolves the connection import cycle
+from meshmon.connection.connection import RawConnection
+from meshmon.connection.grpc_client import PACKET_BATCH_METADATA, supports_batching
+from meshmon.connection.grpc_server import MeshMonServicer
+from meshmon.connection.proto import PacketData, ProtocolData
+
+NEW_PEER = (("client-nonce", "abc"), PACKET_BATCH_METADATA)
+OLD_PEER = (("client-nonce", "abc"),)
+
+
+class NullProtocol:
+    def handle_packet(self, request, conn):
+        pass
+
+
+class Receiver:
+    """Stands in for the remote RawConnection fed by request_handler."""
+
+    is_closed = False
+
+    def __init__(self):
+        self.packets: list[str] = []
+
+    def handle_request(self, request: PacketData):
+        self.packets.append(request.packet_id)
+
+    def close(self):
+        pass
+
+
+class Servicer:
+    logger = structlog.stdlib.get_logger()
+
+
+@pytest.fixture
+def conn():
+    raw_conn = RawConnection(NullProtocol(), "net", "b", "local")
+    yield raw_conn
+    raw_conn.close()
+
+
+def queue_packets(conn: RawConnection, *packet_ids: str):
+    for packet_id in packet_ids:
+        conn.stream_writer.put(
+            ProtocolData(packet_data=PacketData(packet_id=packet_id))
+        )
+
+
+def drain(conn: RawConnection, batching: bool) -> list[ProtocolData]:
+    """Read frames until the close sentinel, failing instead of hanging."""
+    frames: list[ProtocolData] = []
+    read = conn.packet_reader(batching)
+
+    def run():
+        while (frame := read()) is not None:
+            frames.append(frame)
+
+    reader = threading.Thread(target=run, daemon=True)
+    reader.start()
+    reader.join(timeout=2)
+    assert not reader.is_alive(), "reader did not see the close sentinel"
+    return frames
+
+
+def deliver(frames: list[ProtocolData]) -> list[str]:
+    receiver = Receiver()
+    MeshMonServicer.request_handler(Servicer(), iter(frames), receiver, None)
+    return receiver.packets
+
+
+@pytest.mark.parametrize(
+    ("metadata", "batching"),
+    [(NEW_PEER, True), (OLD_PEER, False), ((), False)],
+)
+def test_batching_negotiation(metadata, batching):
+    assert supports_batching(metadata) is batching
+    assert supports_batching([(k, v.encode()) for k, v in metadata]) is batching
+
+
+def test_batching_peer_gets_coalesced_frames(conn):
+    queue_packets(conn, "1", "2", "3")
+    conn.close()
+
+    frames = drain(conn, supports_batching(NEW_PEER))
+
+    assert [f.WhichOneof("message_type") for f in frames] == ["packet_batch"]
+    assert deliver(frames) == ["1", "2", "3"]
+
+
+def test_old_peer_only_gets_single_packets(conn):
+    queue_packets(conn, "1", "2", "3")
+    conn.close()
+
+    frames = drain(conn, supports_batching(OLD_PEER))
+
+    assert {f.WhichOneof("message_type") for f in frames} == {"packet_data"}
+    assert deliver(frames) == ["1", "2", "3"]
+
+
+def test_batch_size_is_capped(conn):
+    queue_packets(conn, *map(str, range(5)))
+    conn.close()
+
+    first = conn.get_batch(max_items=2)
+    assert len(first.packet_batch.packets) == 2
+    frames = [first, *drain(conn, True)]
+    assert deliver(frames) == ["0", "1", "2", "3", "4"]
+
+
+def test_close_mid_batch_keeps_sentinel(conn):
+    queue_packets(conn, "1", "2")
+    conn.close()
+    # Packets queued after close still sit behind the sentinel
+    queue_packets(conn, "late")
+
+    batch = conn.get_batch()
+    assert [p.packet_id for p in batch.packet_batch.packets] == ["1", "2"]
+    # The sentinel must survive the partial batch so the writer stops
+    assert conn.get_batch() is None
@@ -0,0 +1,32 @@
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from src.meshmon.pulsewave import crypto
+from src.meshmon.pulsewave.crypto import Verifier
+
+
+def test_verified_cache_is_lru(monkeypatch):
+    monkeypatch.setattr(crypto, "VERIFIED_CACHE_SIZE", 2)
+    key = Ed25519PrivateKey.generate()
+    verifier = Verifier("peer", key.public_key())
+    messages = [b"hot", b"cold", b"new"]
+    signatures = {m: key.sign(m) for m in messages}
+
+    assert verifier.verify(b"hot", signatures[b"hot"])
+    assert verifier.verify(b"cold", signatures[b"cold"])
+    # A hit refreshes the entry, so the next insert evicts "cold" instead
+    assert verifier.verify(b"hot", signatures[b"hot"])
+    assert verifier.verify(b"new", signatures[b"new"])
+    assert len(verifier._verified) == 2
+
+    # Only cached signatures can pass once the key stops verifying
+    verifier.public_key = Ed25519PrivateKey.generate().public_key()
+    assert verifier.verify(b"hot", signatures[b"hot"])
+    assert verifier.verify(b"new", signatures[b"new"])
+    assert not verifier.verify(b"cold", signatures[b"cold"])
+
+
+def test_uncached_verify_leaves_cache_alone():
+    key = Ed25519PrivateKey.generate()
+    verifier = Verifier("peer", key.public_key())
+    assert verifier.verify(b"nonce", key.sign(b"nonce"), cache=False)
+    assert not verifier._verified
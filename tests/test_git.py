@@ -0,0 +1,58 @@
+import subprocess
+
+from src.meshmon.git import Repo
+
+
+def git(cwd, *args):
+    return subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.email=test@example.com",
+            "-c",
+            "user.name=test",
+            *args,
+        ],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def make_clone(tmp_path):
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    git(upstream, "init", "-q", "-b", "main")
+    git(upstream, "commit", "-q", "--allow-empty", "-m", "one")
+    repo = Repo(str(upstream), str(tmp_path / "clone"))
+    repo.clone_or_update()
+    return upstream, repo
+
+
+def test_head_cache_follows_branch_ref(tmp_path):
+    upstream, repo = make_clone(tmp_path)
+    clone = repo.repo_path
+    assert repo._get_current_commit_hash() == git(clone, "rev-parse", "HEAD")
+
+    # Moving the branch leaves the HEAD symref untouched
+    git(clone, "commit", "-q", "--allow-empty", "-m", "two")
+    assert repo._get_current_commit_hash() == git(clone, "rev-parse", "HEAD")
+
+    # Refs that only live in packed-refs
+    git(clone, "pack-refs", "--all")
+    git(clone, "update-ref", "refs/heads/main", "HEAD~1")
+    assert repo._get_current_commit_hash() == git(clone, "rev-parse", "HEAD")
+    assert repo.needs_update() is False
+
+
+def test_head_cache_in_worktree(tmp_path):
+    upstream, repo = make_clone(tmp_path)
+    worktree = tmp_path / "worktree"
+    git(repo.repo_path, "worktree", "add", "-q", "-b", "wt", str(worktree))
+
+    wt_repo = Repo(str(upstream), str(worktree), branch="main")
+    assert wt_repo._get_current_commit_hash() == git(worktree, "rev-parse", "HEAD")
+    git(worktree, "commit", "-q", "--allow-empty", "-m", "two")
+    assert wt_repo._get_current_commit_hash() == git(worktree, "rev-parse", "HEAD")
+    assert wt_repo._head_cache is not None
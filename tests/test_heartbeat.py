@@ -0,0 +1,38 @@
+# pyright: reportArgumentType=false
+# The store is only touched by the ping sweep, which these tests never run
+import math
+
+import meshmon.distrostore  # noqa: F401  # resolves the connection import cycle
+from meshmon.config.bus import ConfigBus
+from meshmon.connection.connection import ConnectionManager
+from meshmon.connection.heartbeat import HeartbeatController
+
+
+def test_peer_readded_while_unscheduling_stays_scheduled():
+    manager = ConnectionManager(ConfigBus())
+    controller = HeartbeatController(manager, ConfigBus(), None)
+    manager.add_connection("b", "a", "net")
+    assert controller._pop_due(math.inf) == [("net", "b")]
+
+    # The loop sees the peer gone, then a reload re-adds it before the
+    # loop drops the key, so schedule() skips the new connection
+    manager.remove_connection("b", "net")
+    assert manager.get_connection("b", "net") is None
+    manager.add_connection("b", "a", "net")
+    controller._unschedule("net", "b")
+
+    assert ("net", "b") in controller._scheduled
+    assert controller._pop_due(math.inf) == [("net", "b")]
+
+
+def test_removed_peer_is_unscheduled():
+    manager = ConnectionManager(ConfigBus())
+    controller = HeartbeatController(manager, ConfigBus(), None)
+    manager.add_connection("b", "a", "net")
+    controller._pop_due(math.inf)
+
+    manager.remove_connection("b", "net")
+    controller._unschedule("net", "b")
+
+    assert controller._scheduled == set()
+    assert controller._pop_due(math.inf) == []
@@ -0,0 +1,69 @@
+# pyright: reportArgumentType=false
+# The fakes below only implement what the code under test calls
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+import meshmon.distrostore  # noqa: F401  # resolves the connection import cycle
+from meshmon.config.bus import ConfigWatcher
+from meshmon.connection.grpc_types import StoreUpdate, Validator
+from meshmon.connection.protocol_handler import ConnectionConfig, PulseWaveProtocol
+from meshmon.pulsewave.crypto import Signer, Verifier
+from meshmon.pulsewave.data import SignedBlockData
+
+
+class FakeHandler:
+    def __init__(self, results):
+        self.results = list(results)
+        self.updates = []
+
+    def handle_incoming_update(self, update):
+        self.updates.append(update)
+        return self.results.pop(0)
+
+
+class FakeConn:
+    def send_response(self, response):
+        pass
+
+
+def make_protocol(signer, verifier, handler, local_nonce, remote_nonce):
+    config = ConnectionConfig(
+        verifier=verifier,
+        signer=signer,
+        remote_node_id=verifier.node_id,
+        local_node_id=signer.node_id,
+        network_id="net",
+    )
+    mr_sbd = SignedBlockData.new(
+        signer, Validator("x", "y", "net", "z").to_dict(), "validator"
+    )
+    mr_sbd.date = mr_sbd.date.replace(year=2000)
+    return PulseWaveProtocol(
+        handler=handler,
+        remote_nonce=remote_nonce,
+        local_nonce=local_nonce,
+        watcher=ConfigWatcher(None, config),
+        mr_sbd=mr_sbd,
+    )
+
+
+def test_identical_store_update_is_retried_until_merged():
+    key_a, key_b = Ed25519PrivateKey.generate(), Ed25519PrivateKey.generate()
+    sender = make_protocol(
+        Signer("a", key_a), Verifier("b", key_b.public_key()), None, "na", "nb"
+    )
+    # Unbound store, then a successful merge
+    handler = FakeHandler([False, True])
+    receiver = make_protocol(
+        Signer("b", key_b),
+        Verifier("a", key_a.public_key()),
+        handler,
+        "nb",
+        "na",
+    )
+
+    for _ in range(3):
+        packet = sender.build_packet(StoreUpdate('{"nodes": {}}'))
+        assert packet is not None
+        receiver.handle_packet(packet.packet_data, FakeConn())
+
+    assert len(handler.updates) == 2
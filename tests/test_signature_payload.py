@@ -0,0 +1,88 @@
+import base64
+import datetime
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from pydantic import BaseModel
+
+from meshmon.pulsewave.crypto import Signer, Verifier
+from meshmon.pulsewave.data import (
+    DateEvalType,
+    SignedBlockData,
+    _block_signature_payload,
+)
+
+
+class SignedBlockSignature(BaseModel):
+    """The model older peers still sign and verify blocks with."""
+
+    date: datetime.datetime
+    data: dict
+    block_id: str
+    secret: str | None = None
+    replacement_type: DateEvalType
+
+
+DATES = [
+    datetime.datetime(2024, 5, 6, 7, 8, 9),
+    datetime.datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=datetime.timezone.utc),
+    datetime.datetime(
+        2024, 5, 6, 7, 8, 9, 120, datetime.timezone(datetime.timedelta(hours=-5))
+    ),
+]
+DATA = [
+    {},
+    {"node_time": 1, "rtt": 0.25, "nested": {"ok": True, "ids": ["a", None]}},
+    {"name": "nøde ☃", "quote": 'a"b\\c'},
+]
+
+
+def legacy_payload(data, date, block_id, secret, replacement_type) -> bytes:
+    return (
+        SignedBlockSignature(
+            data=data,
+            date=date,
+            block_id=block_id,
+            secret=secret,
+            replacement_type=replacement_type,
+        )
+        .model_dump_json()
+        .encode()
+    )
+
+
+@pytest.mark.parametrize("replacement_type", list(DateEvalType))
+@pytest.mark.parametrize("secret", [None, "s3cret"])
+@pytest.mark.parametrize("data", DATA)
+@pytest.mark.parametrize("date", DATES)
+def test_payload_matches_legacy_model(date, data, secret, replacement_type):
+    args = (data, date, "block", secret, replacement_type)
+    assert _block_signature_payload(*args) == legacy_payload(*args)
+
+
+def test_legacy_signature_verifies():
+    key = Ed25519PrivateKey.generate()
+    date = DATES[1]
+    data = DATA[1]
+    payload = legacy_payload(data, date, "block", None, DateEvalType.NEWER)
+    block = SignedBlockData(
+        data=data,
+        date=date,
+        block_id="block",
+        replacement_type=DateEvalType.NEWER,
+        signature=base64.b64encode(key.sign(payload)).decode(),
+    )
+    assert block.verify(Verifier("peer", key.public_key()), "block", cache=False)
+
+    # And the other way round: a new block checks out against the old payload
+    new_block = SignedBlockData.new(Signer("peer", key), data, "block")
+    key.public_key().verify(
+        base64.b64decode(new_block.signature),
+        legacy_payload(
+            new_block.data,
+            new_block.date,
+            "block",
+            None,
+            new_block.replacement_type,
+        ),
+    )
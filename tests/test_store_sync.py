@@ -0,0 +1,246 @@
+# pyright: reportArgumentType=false
+# The fakes below only implement what the code under test calls
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from pydantic import BaseModel
+
+import meshmon.distrostore  # noqa: F401  # resolves the connection import cycle
+from meshmon.config.bus import ConfigWatcher
+from meshmon.connection import update_handler
+from meshmon.connection.update_handler import GrpcUpdateHandler
+from meshmon.pulsewave.config import CurrentNode, NodeConfig, PulseWaveConfig
+from meshmon.pulsewave.crypto import KeyMapping, Signer, Verifier
+from meshmon.pulsewave.data import StoreContextData, StoreData, StoreNodeData
+from meshmon.pulsewave.views import ConsistencyContextView, MutableStoreCtxView
+
+KEY_A = Ed25519PrivateKey.generate()
+KEY_B = Ed25519PrivateKey.generate()
+SIGNER_A = Signer("a", KEY_A)
+VERIFIER_A = Verifier("a", KEY_A.public_key())
+VERIFIER_B = Verifier("b", KEY_B.public_key())
+# What peer b uses to accept node a's data
+PEER_KEYS = KeyMapping(Signer("b", KEY_B), {"a": VERIFIER_A})
+SOURCE_KEYS = KeyMapping(SIGNER_A, {"a": VERIFIER_A})
+CC_PATH = "nodes.a.consistency.consistent_contexts.cc"
+
+
+class Entry(BaseModel):
+    value: int
+
+
+class NullUpdates:
+    def trigger_update(self, paths):
+        pass
+
+
+def ctx_view(store: StoreData, name: str = "ctx") -> MutableStoreCtxView[Entry]:
+    node = store.nodes.setdefault("a", StoreNodeData.new())
+    context = node.contexts.get(name)
+    if context is None:
+        context = node.contexts[name] = StoreContextData.new(SIGNER_A, name)
+    return MutableStoreCtxView(
+        f"nodes.a.contexts.{name}", context, Entry, SIGNER_A, NullUpdates()
+    )
+
+
+def consistency_view(store: StoreData) -> ConsistencyContextView[Entry]:
+    return ConsistencyContextView(
+        store, "cc", CC_PATH, Entry, SOURCE_KEYS, NullUpdates()
+    )
+
+
+def copy(store: StoreData) -> StoreData:
+    return StoreData.model_validate_json(store.model_dump_json())
+
+
+def make_source() -> StoreData:
+    store = StoreData()
+    view = ctx_view(store)
+    view.set("k1", Entry(value=1))
+    view.set("k2", Entry(value=2))
+    consistency_view(store)
+    return store
+
+
+def set_new_key(store):
+    ctx_view(store).set("k3", Entry(value=3))
+
+
+def overwrite_key(store):
+    ctx_view(store).set("k1", Entry(value=10))
+
+
+def delete_key(store):
+    ctx_view(store).delete("k1")
+
+
+def resign_context(store):
+    context = store.nodes["a"].contexts["ctx"]
+    context.allowed_keys = ["k2"]
+    context.resign(SIGNER_A, "nodes.a.contexts.ctx")
+
+
+def add_context(store):
+    ctx_view(store, "other").set("x", Entry(value=1))
+
+
+def add_consistency_context(store):
+    ConsistencyContextView(
+        store, "cc2", CC_PATH + "2", Entry, SOURCE_KEYS, NullUpdates()
+    )
+
+
+def delete_consistency_context(store):
+    consistency = store.nodes["a"].consistency
+    del consistency.consistent_contexts["cc"]
+    consistency.allowed_contexts.remove("cc")
+    consistency.resign(SIGNER_A, CC_PATH)
+
+
+def change_leader(store):
+    view = consistency_view(store)
+    leader = view.leader_status
+    assert leader is not None
+    view.leader_status = leader.model_copy(update={"node_id": "a"})
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        set_new_key,
+        overwrite_key,
+        delete_key,
+        resign_context,
+        add_context,
+        add_consistency_context,
+        delete_consistency_context,
+        change_leader,
+    ],
+)
+def test_delta_converges(mutate):
+    source = make_source()
+    peer = copy(source)
+    baseline = copy(source)
+
+    mutate(source)
+    delta = source.diff(baseline)
+    assert delta.nodes
+    peer.update(StoreData.model_validate_json(delta.model_dump_json()), PEER_KEYS)
+
+    assert peer.model_dump() == source.model_dump()
+
+
+def test_unchanged_diff_is_empty():
+    source = make_source()
+    assert source.diff(copy(source)).nodes == {}
+
+
+class FakeUpdateManager:
+    version = 0
+
+
+class FakeStore:
+    def __init__(self, data: StoreData):
+        self.data = data
+        self.update_manager = FakeUpdateManager()
+        self.config = PulseWaveConfig(
+            current_node=CurrentNode("a", SIGNER_A, VERIFIER_A),
+            nodes={"b": NodeConfig("b", "", VERIFIER_B, 1.0, 3)},
+            update_rate_limit=1.0,
+            instant_update_rate_limit=1.0,
+            clock_pulse_interval=1.0,
+            avg_clock_pulses=1,
+        )
+        self.config_watcher = ConfigWatcher(None, self.config)
+
+    def dump(self) -> str:
+        return self.data.model_dump_json()
+
+    def write(self, mutate) -> None:
+        mutate(self.data)
+        self.update_manager.version += 1
+
+
+class FakePeer:
+    generation = 1
+
+    def __init__(self):
+        self.store = StoreData()
+        self.dropping = False
+
+    def send_response(self, update) -> bool:
+        # A dropped update still looks sent, like one lost or rejected remotely
+        if not self.dropping:
+            self.store.update(StoreData.model_validate_json(update.data), PEER_KEYS)
+        return True
+
+
+class FakeConnectionManager:
+    def __init__(self, peer: FakePeer):
+        self.peer = peer
+
+    def get_connection(self, node_id, network_id):
+        return self.peer if node_id == "b" else None
+
+
+def test_full_sync_repairs_missed_delta(monkeypatch):
+    store = FakeStore(make_source())
+    peer = FakePeer()
+    handler = GrpcUpdateHandler("net", FakeConnectionManager(peer))
+    handler.bind(store, None)
+    now = 0.0
+    monkeypatch.setattr(update_handler.time, "monotonic", lambda: now)
+
+    handler.handle_update()
+    assert peer.store.model_dump() == store.data.model_dump()
+
+    peer.dropping = True
+    store.write(set_new_key)
+    handler.handle_update()
+    peer.dropping = False
+    store.write(overwrite_key)
+    handler.handle_update()
+    # The second delta only carries k1, so k3 is still missing
+    assert "k3" not in peer.store.nodes["a"].contexts["ctx"].data
+
+    now = update_handler.FULL_SYNC_INTERVAL + 1
+    handler.handle_update()
+    assert peer.store.model_dump() == store.data.model_dump()
+
+
+def test_rebind_unsubscribes_previous_store():
+    old_store, new_store = FakeStore(StoreData()), FakeStore(StoreData())
+    handler = GrpcUpdateHandler("net", FakeConnectionManager(FakePeer()))
+    handler.bind(old_store, None)
+    handler.bind(old_store, None)
+    assert len(old_store.config_watcher.subscribers) == 1
+
+    handler.bind(new_store, None)
+    assert old_store.config_watcher.subscribers == []
+    assert len(new_store.config_watcher.subscribers) == 1
+
+
+def test_context_resign_reports_full_paths():
+    store = make_source()
+    context = store.nodes["a"].contexts["ctx"]
+    context.allowed_keys = ["k2"]
+
+    paths = context.resign(SIGNER_A, "nodes.a.contexts.ctx")
+
+    assert paths == ["nodes.a.contexts.ctx", "nodes.a.contexts.ctx.k1"]
+    assert context.data.keys() == {"k2"}
+
+
+def test_consistency_resign_keeps_allowed_contexts():
+    store = make_source()
+    # Adding a second context re-signs the allowed list
+    add_consistency_context(store)
+    consistency = store.nodes["a"].consistency
+    assert consistency is not None
+    assert consistency.consistent_contexts.keys() == {"cc", "cc2"}
+
+    consistency.allowed_contexts.remove("cc")
+    paths = consistency.resign(SIGNER_A, "nodes.a.consistency")
+
+    assert consistency.consistent_contexts.keys() == {"cc2"}
+    assert "nodes.a.consistency.consistent_contexts.cc" in paths